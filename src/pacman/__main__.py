@@ -5,9 +5,23 @@ Allows running the package as a module: python -m pacman
 """
 
 import sys
-from typing import NoReturn
+from typing import List, NoReturn, Optional
 
-from .cli.main import main
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Console script entry point; answers --version without loading the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if "--version" in argv or "-v" in argv:
+        from pacman import __version__
+
+        print(f"Token Manager {__version__}")
+        return 0
+
+    from pacman.cli.main import main as cli_main
+
+    return cli_main(argv)
 
 
 def _main() -> NoReturn:
@@ -3,47 +3,76 @@
 import argparse
 import contextlib
 import logging
+import os
 import signal
 import sys
+import threading
 import time
 import traceback
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
-from typing import Any, Callable, Dict, List, NoReturn, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    NoReturn,
+    Optional,
+    Tuple,
+    Union,
+)
 
-from rich.console import Console
+from pacman import __version__
+from pacman.core.plans import Plans, PlanType, get_token_limit
 
+# Settings (pydantic) and the monitoring, data, terminal and UI stacks are
+# imported inside the functions that use them so --version stays cheap.
+if TYPE_CHECKING:
+    from rich.console import Console
 
+logger = logging.getLogger(__name__)
 
-from pacman import __version__
-from pacman.cli.bootstrap import (
-    ensure_directories,
-    init_timezone,
-    setup_environment,
-    setup_logging,
+# Shown when auto compact fires during realtime monitoring
+COMPACT_MESSAGE = (
+    "\n✓ Auto compact triggered"
+    "\n  → Usage {pct:.1f}% exceeded {threshold:.0f}% threshold"
+    "\n  → Next auto action available in {mins} min"
 )
-from pacman.core.plans import Plans, PlanType, get_token_limit
-from pacman.core.settings import Settings
-from pacman.data.aggregator import UsageAggregator
-from pacman.data.analysis import analyze_usage
-from pacman.error_handling import report_error
-from pacman.monitoring.orchestrator import MonitoringOrchestrator
-from pacman.terminal.manager import (
-    enter_alternate_screen,
-    handle_cleanup_and_exit,
-    handle_error_and_exit,
-    restore_terminal,
-    setup_terminal,
-)
-from pacman.terminal.input_handler import poll_keyboard, handle_keypress
-from pacman.terminal.themes import get_themed_console, print_themed
-from pacman.ui.display_controller import DisplayController
-from pacman.ui.table_views import TableViewsController
 
 # Type aliases for CLI callbacks
 DataUpdateCallback = Callable[[Dict[str, Any]], None]
 SessionChangeCallback = Callable[[str, str, Optional[Dict[str, Any]]], None]
 
 
+@dataclass(frozen=True)
+class MonitorOptions:
+    """Realtime monitor settings, read once from the CLI namespace."""
+
+    view: str = "realtime"
+    theme: Optional[str] = None
+    refresh_rate: int = 10
+    refresh_per_second: float = 0.75
+    auto_compact: bool = False
+    no_motion: bool = False
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> "MonitorOptions":
+        """Build options from args, keeping defaults for missing attributes."""
+        return cls(
+            view=getattr(args, "view", cls.view),
+            theme=getattr(args, "theme", cls.theme),
+            refresh_rate=getattr(args, "refresh_rate", cls.refresh_rate),
+            refresh_per_second=getattr(
+                args, "refresh_per_second", cls.refresh_per_second
+            ),
+            auto_compact=getattr(args, "auto_compact", cls.auto_compact),
+            no_motion=getattr(args, "no_motion", cls.no_motion),
+        )
+
+
 def get_standard_claude_paths() -> List[str]:
     """Get list of standard Claude data directory paths to check."""
     return ["~/.claude/projects", "~/.config/claude/projects"]
@@ -58,18 +87,26 @@ def discover_claude_data_paths(custom_paths: Optional[List[str]] = None) -> List
     Returns:
         List of Path objects for existing Claude data directories
     """
-    paths_to_check: List[str] = (
-        [str(p) for p in custom_paths] if custom_paths else get_standard_claude_paths()
+    paths_to_check: Tuple[str, ...] = (
+        tuple(str(p) for p in custom_paths)
+        if custom_paths
+        else tuple(get_standard_claude_paths())
     )
 
+    return list(_discover_data_paths(paths_to_check))
+
+
+@lru_cache(maxsize=8)
+def _discover_data_paths(paths_to_check: Tuple[str, ...]) -> Tuple[Path, ...]:
+    """Resolve paths_to_check and keep the existing directories (memoized)."""
     discovered_paths: List[Path] = []
 
     for path_str in paths_to_check:
-        path = Path(path_str).expanduser().resolve()
-        if path.exists() and path.is_dir():
-            discovered_paths.append(path)
+        expanded = os.path.expanduser(path_str)
+        if os.path.isdir(expanded):
+            discovered_paths.append(Path(os.path.realpath(expanded)))
 
-    return discovered_paths
+    return tuple(discovered_paths)
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -81,6 +118,14 @@ def main(argv: Optional[List[str]] = None) -> int:
         print(f"Token Manager {__version__}")
         return 0
 
+    from pacman.cli.bootstrap import (
+        ensure_directories,
+        init_timezone,
+        setup_environment,
+        setup_logging,
+    )
+    from pacman.core.settings import Settings
+
     try:
         settings = Settings.load_with_last_used(argv)
 
@@ -104,7 +149,6 @@ def main(argv: Optional[List[str]] = None) -> int:
         print("\n\nMonitoring stopped by user.")
         return 0
     except Exception as e:
-        logger = logging.getLogger(__name__)
         logger.error(f"Monitor failed: {e}", exc_info=True)
         traceback.print_exc()
         return 1
@@ -112,10 +156,24 @@ def main(argv: Optional[List[str]] = None) -> int:
 
 def _run_monitoring(args: argparse.Namespace) -> None:
     """Main monitoring implementation without facade."""
-    view_mode = getattr(args, "view", "realtime")
+    from pacman.error_handling import report_error
+    from pacman.monitoring.orchestrator import MonitoringOrchestrator
+    from pacman.terminal.input_handler import get_action_state, spawn_claude
+    from pacman.terminal.manager import (
+        enter_alternate_screen,
+        handle_cleanup_and_exit,
+        handle_error_and_exit,
+        restore_terminal,
+        setup_terminal,
+    )
+    from pacman.terminal.themes import get_themed_console, print_themed
+    from pacman.ui.display_controller import DisplayController
+
+    options = MonitorOptions.from_args(args)
+    view_mode = options.view
 
-    if hasattr(args, "theme") and args.theme:
-        console = get_themed_console(force_theme=args.theme.lower())
+    if options.theme:
+        console = get_themed_console(force_theme=options.theme.lower())
     else:
         console = get_themed_console()
 
@@ -129,7 +187,6 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             return
 
         data_path: Path = data_paths[0]
-        logger = logging.getLogger(__name__)
         logger.info(f"Using data path: {data_path}")
 
         # Handle different view modes
@@ -142,14 +199,20 @@ def _run_monitoring(args: argparse.Namespace) -> None:
         display_controller = DisplayController()
         display_controller.live_manager._console = console
 
-        refresh_per_second: float = getattr(args, "refresh_per_second", 0.75)
+        refresh_per_second: float = options.refresh_per_second
         logger.info(
             f"Display refresh rate: {refresh_per_second} Hz ({1000 / refresh_per_second:.0f}ms)"
         )
-        logger.info(f"Data refresh rate: {args.refresh_rate} seconds")
+        logger.info(f"Data refresh rate: {options.refresh_rate} seconds")
 
+        # A static border never changes between data updates, so only
+        # redraw when new data arrives instead of on every refresh tick
+        static_frames: bool = display_controller.border_is_static(options.no_motion)
         live_display = display_controller.live_manager.create_live_display(
-            auto_refresh=True, console=console, refresh_per_second=refresh_per_second
+            auto_refresh=not static_frames,
+            console=console,
+            refresh_per_second=refresh_per_second,
+            synchronized=True,
         )
 
         loading_display = display_controller.create_loading_display(
@@ -164,75 +227,117 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             # Enter live context and show loading screen immediately
             live_display.__enter__()
             live_display_active = True
-            live_display.update(loading_display)
+            live_display.update(loading_display, refresh=static_frames)
+
+            # Custom plans compute session percentiles with numpy on the
+            # first data update; import it while the loading screen shows
+            if args.plan == PlanType.CUSTOM.value:
+                threading.Thread(
+                    target=_prewarm_custom_plan_imports, daemon=True
+                ).start()
 
             orchestrator = MonitoringOrchestrator(
-                update_interval=(
-                    args.refresh_rate if hasattr(args, "refresh_rate") else 10
-                ),
+                update_interval=options.refresh_rate,
                 data_path=str(data_path),
             )
             orchestrator.set_args(args)
 
             # Auto-compact state
-            last_compact_time: float = 0.0
-            auto_compact_enabled: bool = getattr(args, "auto_compact", False)
+            last_compact_time: Optional[float] = None
+            auto_compact_enabled: bool = options.auto_compact
             COMPACT_COOLDOWN: int = 600  # 10 minutes in seconds
             COMPACT_THRESHOLD: float = 70.0  # Usage percentage threshold
 
+            # Render throttling state
+            last_render_key: Optional[Tuple[Any, ...]] = None
+
             # Setup monitoring callback
             def on_data_update(monitoring_data: Dict[str, Any]) -> None:
                 """Handle data updates from orchestrator."""
-                nonlocal last_compact_time
+                nonlocal last_compact_time, last_render_key
                 try:
                     data: Dict[str, Any] = monitoring_data.get("data", {})
                     blocks: List[Dict[str, Any]] = data.get("blocks", [])
+                    total_tokens = 0
+                    first_active: Optional[Dict[str, Any]] = None
 
-                    logger.debug(f"Display data has {len(blocks)} blocks")
+                    logger.debug("Display data has %d blocks", len(blocks))
                     if blocks:
-                        active_blocks: List[Dict[str, Any]] = [
-                            b for b in blocks if b.get("isActive")
-                        ]
-                        logger.debug(f"Active blocks: {len(active_blocks)}")
-                        if active_blocks:
+                        first_active = next(
+                            (b for b in blocks if b.get("isActive")), None
+                        )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "Active blocks: %d",
+                                sum(1 for b in blocks if b.get("isActive")),
+                            )
+                        if first_active is not None:
                             # Use billableTokens for rate limits (excludes free cache reads)
-                            total_tokens: int = active_blocks[0].get("billableTokens") or active_blocks[0].get("totalTokens", 0)
-                            logger.debug(f"Active block billable tokens: {total_tokens}")
+                            total_tokens = first_active.get(
+                                "billableTokens"
+                            ) or first_active.get("totalTokens", 0)
+                            logger.debug("Active block billable tokens: %s", total_tokens)
 
                             # Auto-compact logic
                             if auto_compact_enabled:
                                 current_limit = monitoring_data.get("token_limit", token_limit)
                                 if current_limit > 0:
                                     usage_pct = (total_tokens / current_limit) * 100
-                                    current_time_sec = time.time()
+                                    current_time_sec = time.monotonic()
                                     if (
                                         usage_pct >= COMPACT_THRESHOLD
-                                        and current_time_sec - last_compact_time >= COMPACT_COOLDOWN
+                                        and (
+                                            last_compact_time is None
+                                            or current_time_sec - last_compact_time
+                                            >= COMPACT_COOLDOWN
+                                        )
                                     ):
                                         try:
-                                            import subprocess
-                                            subprocess.Popen(
-                                                ["claude", "/compact"],
-                                                stdout=subprocess.DEVNULL,
-                                                stderr=subprocess.DEVNULL,
-                                            )
+                                            spawn_claude(["/compact"])
                                             last_compact_time = current_time_sec
                                             logger.info("Auto compact triggered")
-                                            cooldown_mins = COMPACT_COOLDOWN // 60
-                                            print(
-                                                f"\n✓ Auto compact triggered"
-                                                f"\n  → Usage {usage_pct:.1f}% exceeded {COMPACT_THRESHOLD:.0f}% threshold"
-                                                f"\n  → Next auto action available in {cooldown_mins} min"
+                                            # Print through the Live console so
+                                            # the message lands above the frame
+                                            live_display.console.print(
+                                                COMPACT_MESSAGE.format(
+                                                    pct=usage_pct,
+                                                    threshold=COMPACT_THRESHOLD,
+                                                    mins=COMPACT_COOLDOWN // 60,
+                                                ),
+                                                markup=False,
+                                                highlight=False,
                                             )
                                         except Exception as compact_err:
                                             logger.warning(f"Auto compact failed: {compact_err}")
 
+                    # A static frame only changes with the data, the displayed
+                    # clock, or the pending action prompt. The simple card
+                    # shows whole minutes; the full session screen and the
+                    # no-session screen show an HH:MM:SS clock
+                    if display_controller.use_simple_display and first_active:
+                        clock_resolution = 60
+                    else:
+                        clock_resolution = 1
+                    render_key = (
+                        tuple(
+                            (b.get("id"), b.get("totalTokens"), b.get("isActive"))
+                            for b in blocks
+                        ),
+                        total_tokens,
+                        monitoring_data.get("token_limit"),
+                        int(time.time() // clock_resolution),
+                        get_action_state().current_action,
+                    )
+                    if static_frames and render_key == last_render_key:
+                        return
+
                     renderable = display_controller.create_data_display(
                         data, args, monitoring_data.get("token_limit", token_limit)
                     )
 
                     if live_display:
-                        live_display.update(renderable)
+                        live_display.update(renderable, refresh=static_frames)
+                    last_render_key = render_key
 
                 except Exception as e:
                     logger.error(f"Display update error: {e}", exc_info=True)
@@ -265,14 +370,9 @@ def _run_monitoring(args: argparse.Namespace) -> None:
             if not orchestrator.wait_for_initial_data(timeout=10.0):
                 logger.warning("Timeout waiting for initial data")
 
-            # Main loop - poll for keyboard input while display is active
-            while True:
-                key = poll_keyboard(timeout=0.2)
-                if key:
-                    result = handle_keypress(key)
-                    if result:
-                        # Show feedback briefly - it will be overwritten on next update
-                        logger.info(result)
+            # Main loop - the orchestrator thread redraws on new data, so
+            # this thread only has to sleep until a key (or Ctrl+C) arrives
+            _read_keys_until_interrupt()
         finally:
             # Stop monitoring first
             if "orchestrator" in locals():
@@ -284,16 +384,9 @@ def _run_monitoring(args: argparse.Namespace) -> None:
                     live_display.__exit__(None, None, None)
 
     except KeyboardInterrupt:
-        # Clean exit from live display if it's active
-        if "live_display" in locals():
-            with contextlib.suppress(Exception):
-                live_display.__exit__(None, None, None)
+        # The live display was already exited by the inner finally
         handle_cleanup_and_exit(old_terminal_settings)
     except Exception as e:
-        # Clean exit from live display if it's active
-        if "live_display" in locals():
-            with contextlib.suppress(Exception):
-                live_display.__exit__(None, None, None)
         handle_error_and_exit(old_terminal_settings, e)
     finally:
         restore_terminal(old_terminal_settings)
@@ -303,11 +396,12 @@ def _get_initial_token_limit(
     args: argparse.Namespace, data_path: Union[str, Path]
 ) -> int:
     """Get initial token limit for the plan."""
-    logger = logging.getLogger(__name__)
+    from pacman.terminal.themes import print_themed
+
     plan: str = getattr(args, "plan", PlanType.PRO.value)
 
     # For custom plans, check if custom_limit_tokens is provided first
-    if plan == "custom":
+    if plan == PlanType.CUSTOM.value:
         # If custom_limit_tokens is explicitly set, use it
         if hasattr(args, "custom_limit_tokens") and args.custom_limit_tokens:
             custom_limit = int(args.custom_limit_tokens)
@@ -318,6 +412,8 @@ def _get_initial_token_limit(
             return custom_limit
 
         # Otherwise, analyze usage data to calculate P90
+        from pacman.data.analysis import analyze_usage
+
         print_themed("Analyzing usage data to determine cost limits...", style="info")
 
         try:
@@ -363,8 +459,6 @@ def handle_application_error(
         component: Component where the error occurred
         exit_code: Exit code to use when terminating
     """
-    logger = logging.getLogger(__name__)
-
     # Log the error with traceback
     logger.error(f"Application error in {component}: {exception}", exc_info=True)
 
@@ -400,13 +494,10 @@ def validate_cli_environment() -> Optional[str]:
 
         # Check for required dependencies
         required_modules = ["rich", "pydantic", "watchdog"]
-        missing_modules: List[str] = []
-
-        for module in required_modules:
-            try:
-                __import__(module)
-            except ImportError:
-                missing_modules.append(module)
+        # find_spec only locates the modules; it does not import them
+        missing_modules: List[str] = [
+            module for module in required_modules if find_spec(module) is None
+        ]
 
         if missing_modules:
             return f"Missing required modules: {', '.join(missing_modules)}"
@@ -418,10 +509,12 @@ def validate_cli_environment() -> Optional[str]:
 
 
 def _run_table_view(
-    args: argparse.Namespace, data_path: Path, view_mode: str, console: Console
+    args: argparse.Namespace, data_path: Path, view_mode: str, console: "Console"
 ) -> None:
     """Run table view mode (daily/monthly)."""
-    logger = logging.getLogger(__name__)
+    from pacman.data.aggregator import UsageAggregator
+    from pacman.terminal.themes import print_themed
+    from pacman.ui.table_views import TableViewsController
 
     try:
         # Create aggregator with appropriate mode
@@ -459,13 +552,7 @@ def _run_table_view(
         # Wait for user to press Ctrl+C
         print_themed("\nPress Ctrl+C to exit", style="info")
         try:
-            # Use signal.pause() for more efficient waiting
-            try:
-                signal.pause()
-            except AttributeError:
-                # Fallback for Windows which doesn't support signal.pause()
-                while True:
-                    time.sleep(1)
+            _wait_for_interrupt()
         except KeyboardInterrupt:
             print_themed("\nExiting...", style="info")
 
@@ -474,5 +561,50 @@ def _run_table_view(
         print_themed(f"Error displaying {view_mode} view: {e}", style="error")
 
 
+def _prewarm_custom_plan_imports() -> None:
+    """Import modules first needed by custom-plan rendering."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError as e:
+        logger.debug("Import prewarm skipped: %s", e)
+
+
+def _read_keys_until_interrupt() -> NoReturn:
+    """Handle keypresses until interrupted, or just wait once stdin closes."""
+    from pacman.terminal.input_handler import (
+        handle_keypress,
+        keyboard_available,
+        poll_keyboard,
+    )
+
+    if not keyboard_available():
+        _wait_for_interrupt()
+    while True:
+        try:
+            key = poll_keyboard(timeout=None)
+        except EOFError as e:
+            # A closed stdin is always "readable", so polling again would spin
+            logger.debug(f"Keyboard input stopped: {e}")
+            _wait_for_interrupt()
+        if key:
+            result = handle_keypress(key)
+            if result:
+                # Show feedback briefly - it will be overwritten on next update
+                logger.info(result)
+
+
+def _wait_for_interrupt() -> NoReturn:
+    """Block until a signal such as Ctrl+C interrupts the process."""
+    # Use signal.pause() for more efficient waiting
+    try:
+        while True:
+            signal.pause()
+    except AttributeError:
+        # Fallback for Windows which doesn't support signal.pause(); a long
+        # sleep still wakes immediately on Ctrl+C, unlike Event().wait()
+        while True:
+            time.sleep(3600)
+
+
 if __name__ == "__main__":
     sys.exit(main())
@@ -7,10 +7,27 @@ Works with Python 3.9+.
 
 import json
 import logging
+import os
 import sys
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+# orjson is optional; the stdlib fallbacks also work in bytes
+try:
+    import orjson
+
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+    _json_dumps: Callable[[Any], bytes] = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
 
 # Configure logging to stderr (stdout is for MCP protocol)
 logging.basicConfig(
@@ -21,35 +38,170 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Data directory found by get_claude_data_path, reused across requests
+_data_path: Optional[Path] = None
+
+
 def get_claude_data_path() -> Optional[Path]:
-    """Find Claude data directory."""
+    """Find Claude data directory (remembered once found)."""
+    global _data_path
+    if _data_path is not None:
+        return _data_path
+
     paths = ["~/.claude/projects", "~/.config/claude/projects"]
     for path_str in paths:
         path = Path(path_str).expanduser()
         if path.exists():
+            _data_path = path
             return path
     return None
 
 
+def reset_data_path_cache() -> None:
+    """Forget the remembered data directory."""
+    global _data_path
+    _data_path = None
+
+
+class _FileEntry(NamedTuple):
+    """Parsed usage entries of one JSONL file and where parsing stopped."""
+
+    mtime_ns: int
+    size: int
+    # Offset after the last complete line, where appended data starts
+    offset: int
+    # Bytes just before offset, to detect files rewritten in place
+    fingerprint: bytes
+    # Entries from complete lines
+    complete: List[Dict[str, Any]]
+    # Entries from an unterminated final line, reparsed on the next read
+    tail: List[Dict[str, Any]]
+
+
+# Parsed usage entries per JSONL file, keyed by path
+_file_cache: Dict[str, _FileEntry] = {}
+
+# Bytes before the resume offset compared to detect files rewritten in place
+_FINGERPRINT_SIZE = 256
+
+# Read buffer for JSONL files; larger than the default to cut read syscalls
+_READ_BUFFER_SIZE = 64 * 1024
+
+
+def _iter_jsonl_files(root: str) -> Iterator[os.DirEntry]:
+    """Yield every *.jsonl file below root."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_jsonl_files(entry.path)
+                elif entry.name.endswith(".jsonl"):
+                    yield entry
+    except OSError as e:
+        logger.debug(f"Error scanning {root}: {e}")
+
+
+def _parse_usage_line(line: bytes, entries: List[Dict[str, Any]]) -> None:
+    """Append the usage entry on line, if it holds one, to entries."""
+    # Only lines mentioning "usage" can be usage entries
+    if b'"usage"' not in line:
+        return
+    try:
+        entry = _json_loads(line)
+    except ValueError:
+        return
+    if isinstance(entry, dict) and entry.get("type") == "usage":
+        entries.append(entry)
+
+
+def _parse_usage_lines(
+    path: str, offset: int, fingerprint: bytes
+) -> Tuple[int, int, bytes, List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Parse usage entries in path from offset onwards.
+
+    Parsing restarts from the beginning when the bytes just before offset no
+    longer match fingerprint, i.e. the file was rewritten rather than
+    appended to.
+
+    Returns:
+        Tuple of (offset parsing started at, offset after the last complete
+        line, bytes just before that offset, entries from complete lines,
+        entries from an unterminated final line)
+    """
+    complete: List[Dict[str, Any]] = []
+    tail: List[Dict[str, Any]] = []
+    with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+        if offset:
+            f.seek(offset - len(fingerprint))
+            if f.read(len(fingerprint)) != fingerprint:
+                offset = 0
+                f.seek(0)
+        start = offset
+        for line in f:
+            if line.endswith(b"\n"):
+                offset += len(line)
+                _parse_usage_line(line, complete)
+            else:
+                _parse_usage_line(line, tail)
+        fingerprint_start = max(0, offset - _FINGERPRINT_SIZE)
+        f.seek(fingerprint_start)
+        fingerprint = f.read(offset - fingerprint_start)
+    return start, offset, fingerprint, complete, tail
+
+
+def _resume_point(path: str, size: int) -> Tuple[int, bytes, List[Dict[str, Any]]]:
+    """Return where parsing of path resumes, its fingerprint and prior entries."""
+    cached = _file_cache.get(path)
+    # Appended-to files resume after the last complete line
+    if cached is not None and size >= cached.offset:
+        return cached.offset, cached.fingerprint, cached.complete
+    return 0, b"", []
+
+
+def _is_cached(path: str, mtime_ns: int, size: int) -> bool:
+    """Whether the cached entries for path are still current."""
+    cached = _file_cache.get(path)
+    return (
+        cached is not None and cached.mtime_ns == mtime_ns and cached.size == size
+    )
+
+
+def _read_usage_file(path: str, mtime_ns: int, size: int) -> List[Dict[str, Any]]:
+    """Return usage entries in one file, parsing only what changed."""
+    if _is_cached(path, mtime_ns, size):
+        cached = _file_cache[path]
+        return cached.complete + cached.tail
+
+    offset, fingerprint, complete = _resume_point(path, size)
+    start, offset, fingerprint, new, tail = _parse_usage_lines(
+        path, offset, fingerprint
+    )
+    # A rewritten file was reparsed from the start
+    complete = complete + new if start else new
+
+    _file_cache[path] = _FileEntry(mtime_ns, size, offset, fingerprint, complete, tail)
+    return complete + tail
+
+
 def read_usage_blocks(data_path: Path) -> List[Dict[str, Any]]:
     """Read all usage blocks from Claude data files."""
     blocks = []
+    seen = set()
 
-    for jsonl_file in data_path.rglob("*.jsonl"):
+    for jsonl_file in _iter_jsonl_files(str(data_path)):
+        seen.add(jsonl_file.path)
         try:
-            with open(jsonl_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("type") == "usage":
-                            blocks.append(entry)
-                    except json.JSONDecodeError:
-                        continue
+            stat = jsonl_file.stat()
+            blocks.extend(
+                _read_usage_file(jsonl_file.path, stat.st_mtime_ns, stat.st_size)
+            )
         except Exception as e:
-            logger.debug(f"Error reading {jsonl_file}: {e}")
+            _file_cache.pop(jsonl_file.path, None)
+            logger.debug(f"Error reading {jsonl_file.path}: {e}")
+
+    # Forget files that have been removed
+    for path in _file_cache.keys() - seen:
+        del _file_cache[path]
 
     return blocks
 
@@ -73,7 +225,58 @@ def find_active_block(blocks: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
 
 def calculate_usage_stats(blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Calculate usage statistics from blocks."""
-    active_block = find_active_block(blocks)
+    now = datetime.now()
+    seven_days_ago = now - timedelta(days=7)
+    # Block times are compared by wall clock, so "YYYY-MM-DDTHH:MM:SS"
+    # prefixes order exactly like the parsed times down to the second
+    cutoff_str = seven_days_ago.isoformat(timespec="seconds")
+
+    # Single pass: active block (or latest reset as fallback), per-model
+    # totals of active blocks, and the seven-day total
+    active_block: Optional[Dict[str, Any]] = None
+    latest_block: Optional[Dict[str, Any]] = None
+    latest_reset = ""
+    model_usage: Dict[str, int] = defaultdict(int)
+    total_model_tokens = 0
+    weekly_tokens = 0
+
+    for block in blocks:
+        # Key literals are already interned constants; binding the bound
+        # method saves an attribute lookup per field instead
+        get = block.get
+        tokens = get("billableTokens") or get("totalTokens", 0)
+
+        if get("isActive"):
+            if active_block is None:
+                active_block = block
+            model_usage[get("model", "unknown").lower()] += tokens
+            total_model_tokens += tokens
+        elif active_block is None:
+            reset_at = get("resetAt", "")
+            if latest_block is None or reset_at > latest_reset:
+                latest_block, latest_reset = block, reset_at
+
+        start_time_str = get("startTime", get("resetAt", ""))
+        # Malformed blocks without a string timestamp are left out
+        if not start_time_str or not isinstance(start_time_str, str):
+            continue
+        head = start_time_str[:19]
+        if len(head) == 19 and head[10] == "T" and head != cutoff_str:
+            if head > cutoff_str:
+                weekly_tokens += tokens
+        else:
+            # Same second as the cutoff, or an unusual format: parse it
+            try:
+                start_time = datetime.fromisoformat(
+                    start_time_str.replace("Z", "+00:00")
+                )
+                if start_time.replace(tzinfo=None) >= seven_days_ago:
+                    weekly_tokens += tokens
+            except Exception:
+                pass
+
+    if active_block is None:
+        active_block = latest_block
 
     if not active_block:
         return {"error": "No active usage block found"}
@@ -101,36 +304,11 @@ def calculate_usage_stats(blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
         except Exception:
             pass
 
-    model_usage: Dict[str, int] = {}
-    total_model_tokens = 0
-
-    for block in blocks:
-        if block.get("isActive"):
-            model = block.get("model", "unknown").lower()
-            tokens = block.get("billableTokens") or block.get("totalTokens", 0)
-            model_usage[model] = model_usage.get(model, 0) + tokens
-            total_model_tokens += tokens
-
     model_distribution = {}
     for model, tokens in model_usage.items():
         pct = (tokens / total_model_tokens * 100) if total_model_tokens > 0 else 0
         model_distribution[model] = {"tokens": tokens, "percentage": round(pct, 1)}
 
-    now = datetime.now()
-    seven_days_ago = now - timedelta(days=7)
-    weekly_tokens = 0
-
-    for block in blocks:
-        start_time_str = block.get("startTime", block.get("resetAt", ""))
-        if start_time_str:
-            try:
-                start_time = datetime.fromisoformat(start_time_str.replace("Z", "+00:00"))
-                if start_time.replace(tzinfo=None) >= seven_days_ago:
-                    block_tokens = block.get("billableTokens") or block.get("totalTokens", 0)
-                    weekly_tokens += block_tokens
-            except Exception:
-                pass
-
     guidance = get_guidance(usage_pct, model_distribution, minutes_to_reset)
 
     alert_level = "normal"
@@ -160,30 +338,51 @@ def calculate_usage_stats(blocks: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+# Templates for guidance that never varies; get_guidance returns copies so
+# callers can modify results without affecting later responses
+_ACTION_COMPACT = {"prompt": "Run /compact?", "command": "/compact"}
+_ACTION_SONNET = {"prompt": "Switch to Sonnet?", "command": "/model sonnet"}
+_GUIDANCE_CRITICAL = {
+    "message": "You're almost at your limit. Focus on finishing your current task.",
+    "urgency": "critical",
+    "action": _ACTION_COMPACT,
+}
+_GUIDANCE_HALFWAY = {
+    "message": "Halfway through your window. You're pacing well.",
+    "urgency": "normal",
+    "action": None,
+}
+_GUIDANCE_GOOD = {
+    "message": "You're in good shape.",
+    "urgency": "normal",
+    "action": None,
+}
+
+
 def get_guidance(
     usage_pct: float,
     model_distribution: Dict[str, Any],
     minutes_to_reset: float
 ) -> Dict[str, Any]:
-    """Generate contextual guidance based on usage."""
+    """Generate contextual guidance based on usage.
+
+    model_distribution is keyed by lowercased model name, as built by
+    calculate_usage_stats.
+    """
     opus_pct = 0
     for model, data in model_distribution.items():
-        if "opus" in model.lower():
+        if "opus" in model:
             opus_pct = data.get("percentage", 0)
             break
 
     if usage_pct >= 90:
-        return {
-            "message": "You're almost at your limit. Focus on finishing your current task.",
-            "urgency": "critical",
-            "action": {"prompt": "Run /compact?", "command": "/compact"}
-        }
+        return {**_GUIDANCE_CRITICAL, "action": dict(_ACTION_COMPACT)}
 
     if opus_pct > 60 and usage_pct >= 70:
         return {
             "message": f"Opus is handling {opus_pct:.0f}% of your work at {usage_pct:.0f}% usage. Consider switching to Sonnet.",
             "urgency": "warning",
-            "action": {"prompt": "Switch to Sonnet?", "command": "/model sonnet"}
+            "action": dict(_ACTION_SONNET)
         }
 
     if usage_pct >= 75:
@@ -193,30 +392,23 @@ def get_guidance(
         return {
             "message": f"Running low on tokens. Resets in {time_str}.",
             "urgency": "warning",
-            "action": {"prompt": "Run /compact?", "command": "/compact"}
+            "action": dict(_ACTION_COMPACT)
         }
 
     if opus_pct > 60 and usage_pct >= 50:
         return {
             "message": f"Opus is handling {opus_pct:.0f}% of your work. Sonnet is often sufficient and more economical.",
             "urgency": "normal",
-            "action": {"prompt": "Switch to Sonnet?", "command": "/model sonnet"}
+            "action": dict(_ACTION_SONNET)
         }
 
     if usage_pct >= 50:
-        return {
-            "message": "Halfway through your window. You're pacing well.",
-            "urgency": "normal",
-            "action": None
-        }
+        return dict(_GUIDANCE_HALFWAY)
 
-    return {
-        "message": "You're in good shape.",
-        "urgency": "normal",
-        "action": None
-    }
+    return dict(_GUIDANCE_GOOD)
 
 
+@lru_cache(maxsize=1024)
 def format_tokens(tokens: int) -> str:
     """Format token count for display."""
     if tokens >= 1_000_000:
@@ -226,6 +418,34 @@ def format_tokens(tokens: int) -> str:
     return str(tokens)
 
 
+# Alert prefixes for the chomp report, by alert level
+_ALERT_LABELS = {
+    "critical": "**ALMOST OUT!**",
+    "warning": "**Running low** -",
+    "caution": "**Halfway there** -",
+}
+
+# Markdown layout of the chomp report; optional sections are pre-rendered
+_CHOMP_TEMPLATE = (
+    "## Token Usage\n"
+    "\n"
+    "{alert}"
+    "\n"
+    "### Current Session\n"
+    "- **Usage:** {pct}% ({used} / {limit})\n"
+    "- **Remaining:** {remaining}\n"
+    "- **Resets in:** {reset_in}\n"
+    "\n"
+    "### Weekly Total\n"
+    "- **7-day rolling:** {weekly}"
+    "{models}\n"
+    "\n"
+    "### Guidance\n"
+    "_{message}_"
+    "{action}"
+)
+
+
 def handle_chomp() -> str:
     """Handle the chomp tool call."""
     data_path = get_claude_data_path()
@@ -242,54 +462,55 @@ def handle_chomp() -> str:
         return stats["error"]
 
     session = stats["current_session"]
-    weekly = stats["weekly"]
     guidance = stats["guidance"]
 
-    lines = []
-    lines.append("## Token Usage")
-    lines.append("")
-
-    alert_level = stats["alert_level"]
-    if alert_level == "critical":
-        lines.append(f"**ALMOST OUT!** Resets in {session['reset_in']}")
-    elif alert_level == "warning":
-        lines.append(f"**Running low** - Resets in {session['reset_in']}")
-    elif alert_level == "caution":
-        lines.append(f"**Halfway there** - Resets in {session['reset_in']}")
-
-    lines.append("")
-    lines.append("### Current Session")
-    lines.append(f"- **Usage:** {session['usage_percentage']}% ({format_tokens(session['tokens_used'])} / {format_tokens(session['token_limit'])})")
-    lines.append(f"- **Remaining:** {format_tokens(session['tokens_remaining'])}")
-    lines.append(f"- **Resets in:** {session['reset_in']}")
-
-    lines.append("")
-    lines.append("### Weekly Total")
-    lines.append(f"- **7-day rolling:** {format_tokens(weekly['tokens_used'])}")
-
-    if stats["model_breakdown"]:
-        lines.append("")
-        lines.append("### By Model")
-        for model, data in stats["model_breakdown"].items():
-            lines.append(f"- **{model.title()}:** {format_tokens(data['tokens'])} ({data['percentage']}%)")
+    alert_label = _ALERT_LABELS.get(stats["alert_level"])
+    alert = f"{alert_label} Resets in {session['reset_in']}\n" if alert_label else ""
+
+    models = "".join(
+        f"\n- **{model.title()}:** {format_tokens(data['tokens'])} ({data['percentage']}%)"
+        for model, data in stats["model_breakdown"].items()
+    )
+    if models:
+        models = "\n\n### By Model" + models
+
+    action = guidance.get("action")
+
+    return _CHOMP_TEMPLATE.format_map(
+        {
+            "alert": alert,
+            "pct": session["usage_percentage"],
+            "used": format_tokens(session["tokens_used"]),
+            "limit": format_tokens(session["token_limit"]),
+            "remaining": format_tokens(session["tokens_remaining"]),
+            "reset_in": session["reset_in"],
+            "weekly": format_tokens(stats["weekly"]["tokens_used"]),
+            "models": models,
+            "message": guidance["message"],
+            "action": (
+                f"\n\n**Suggested action:** `{action['command']}`" if action else ""
+            ),
+        }
+    )
 
-    lines.append("")
-    lines.append("### Guidance")
-    lines.append(f"_{guidance['message']}_")
 
-    if guidance.get("action"):
-        lines.append("")
-        lines.append(f"**Suggested action:** `{guidance['action']['command']}`")
+# Serializes frames written from the main loop and the tool thread
+_write_lock = threading.Lock()
 
-    return "\n".join(lines)
+# Runs tool calls off the main loop, one at a time (they share file caches)
+_tool_executor: Optional[ThreadPoolExecutor] = None
 
 
 def send_response(response: Dict[str, Any]) -> None:
     """Send JSON-RPC response to stdout."""
-    response_str = json.dumps(response)
-    # MCP uses Content-Length header style framing
-    sys.stdout.write(f"Content-Length: {len(response_str)}\r\n\r\n{response_str}")
-    sys.stdout.flush()
+    payload = _json_dumps(response)
+    # MCP uses Content-Length header style framing; the length is in bytes
+    frame = memoryview(b"Content-Length: %d\r\n\r\n%s" % (len(payload), payload))
+    # Unbuffered write straight to the descriptor; pipes may take it in parts
+    fd = sys.stdout.fileno()
+    with _write_lock:
+        while frame:
+            frame = frame[os.write(fd, frame):]
 
 
 def send_result(id: Any, result: Any) -> None:
@@ -304,26 +525,56 @@ def send_error(id: Any, code: int, message: str) -> None:
 
 def read_message() -> Optional[Dict[str, Any]]:
     """Read a JSON-RPC message from stdin."""
+    # Content-Length counts bytes, so read from the buffered binary stream
+    stdin = sys.stdin.buffer
+
     # Read headers
-    headers = {}
+    headers: Dict[bytes, bytes] = {}
     while True:
-        line = sys.stdin.readline()
+        line = stdin.readline()
         if not line:
             return None
         line = line.strip()
         if not line:
             break
-        if ":" in line:
-            key, value = line.split(":", 1)
+        if b":" in line:
+            key, value = line.split(b":", 1)
             headers[key.strip().lower()] = value.strip()
 
     # Read content
-    content_length = int(headers.get("content-length", 0))
+    content_length = int(headers.get(b"content-length", 0))
     if content_length == 0:
         return None
 
-    content = sys.stdin.read(content_length)
-    return json.loads(content)
+    content = stdin.read(content_length)
+    return _json_loads(content)
+
+
+def _get_tool_executor() -> ThreadPoolExecutor:
+    """Get the tool thread, starting it on first use."""
+    global _tool_executor
+    if _tool_executor is None:
+        _tool_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mcp-tool"
+        )
+    return _tool_executor
+
+
+def _call_tool(id: Any, tool_name: str) -> None:
+    """Run a tool and send its result; executed on the tool thread."""
+    try:
+        if tool_name == "chomp":
+            result_text = handle_chomp()
+            send_result(id, {
+                "content": [
+                    {"type": "text", "text": result_text}
+                ]
+            })
+        else:
+            send_error(id, -32601, f"Unknown tool: {tool_name}")
+    except Exception as e:
+        logger.error(f"Tool {tool_name} failed: {e}", exc_info=True)
+        send_error(id, -32603, f"Internal error: {e}")
 
 
 def handle_request(request: Dict[str, Any]) -> None:
@@ -366,16 +617,8 @@ def handle_request(request: Dict[str, Any]) -> None:
         })
 
     elif method == "tools/call":
-        tool_name = params.get("name", "")
-        if tool_name == "chomp":
-            result_text = handle_chomp()
-            send_result(id, {
-                "content": [
-                    {"type": "text", "text": result_text}
-                ]
-            })
-        else:
-            send_error(id, -32601, f"Unknown tool: {tool_name}")
+        # Tools may be slow; keep reading and answering pings meanwhile
+        _get_tool_executor().submit(_call_tool, id, params.get("name", ""))
 
     elif method == "ping":
         send_result(id, {})
@@ -400,6 +643,10 @@ def main() -> None:
     except Exception as e:
         logger.error(f"Server error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Answer tool calls already received before exiting
+        if _tool_executor is not None:
+            _tool_executor.shutdown(wait=True)
 
 
 if __name__ == "__main__":
@@ -2,22 +2,52 @@
 
 import shutil
 import sys
-from typing import Optional, Set
+import time
+from typing import Dict, Optional, Tuple
+
+_RESET = "\033[0m"
+_DIM = "\033[90m"
+
+# Per threshold: (color, message, default suggestion, show time left instead)
+_ALERT_STYLES: Dict[int, Tuple[str, str, str, bool]] = {
+    50: ("\033[93m", "Halfway there", "Keep an eye on usage", False),  # Bright yellow
+    75: ("\033[38;5;208m", "Running low", "Switch to Sonnet or run /compact", True),
+    90: ("\033[91m", "ALMOST OUT!", "Resets soon", True),  # Bright red
+}
+
+# (top, bottom, blank) box lines per box width
+_BORDER_CACHE: Dict[int, Tuple[str, str, str]] = {}
+
+
+def _box_borders(box_width: int) -> Tuple[str, str, str]:
+    """Return the top, bottom and blank lines of an alert box."""
+    borders = _BORDER_CACHE.get(box_width)
+    if borders is None:
+        horizontal = "─" * box_width
+        borders = (f"╭{horizontal}╮", f"╰{horizontal}╯", f"│{' ' * box_width}│")
+        _BORDER_CACHE[box_width] = borders
+    return borders
 
 
 class ThresholdAlert:
     """Monitors usage and prints alerts when thresholds are crossed."""
 
-    # Thresholds to alert on (percentage)
-    THRESHOLDS = [50, 75, 90]
+    # Thresholds to alert on (percentage), ascending
+    THRESHOLDS = (50, 75, 90)
 
     # Box dimension constraints
     MIN_BOX_WIDTH = 40  # Minimum usable width
     MAX_BOX_WIDTH = 58  # Maximum width (original design)
 
+    # Seconds a measured terminal size is reused before re-querying
+    DIMENSIONS_TTL = 1.0
+
     def __init__(self):
-        self._alerted_thresholds: Set[int] = set()
+        # Index of the next threshold that has not been alerted yet
+        self._next_idx = 0
         self._last_usage_pct: float = 0
+        # (measured at, box_width, content_width)
+        self._dimensions: Optional[Tuple[float, int, int]] = None
 
     def _get_box_dimensions(self) -> tuple[int, int]:
         """Calculate box dimensions based on terminal width.
@@ -25,16 +55,21 @@ class ThresholdAlert:
         Returns:
             Tuple of (box_width, content_width)
         """
+        now = time.monotonic()
+        if self._dimensions is not None and now - self._dimensions[0] < self.DIMENSIONS_TTL:
+            return self._dimensions[1], self._dimensions[2]
+
         terminal_width = shutil.get_terminal_size().columns
         # Leave 2 chars margin on each side
         available_width = terminal_width - 4
         box_width = max(self.MIN_BOX_WIDTH, min(available_width, self.MAX_BOX_WIDTH))
         content_width = box_width - 4  # Account for "│  " and "  │"
+        self._dimensions = (now, box_width, content_width)
         return box_width, content_width
 
     def reset(self) -> None:
         """Reset alerted thresholds (call when usage resets)."""
-        self._alerted_thresholds.clear()
+        self._next_idx = 0
         self._last_usage_pct = 0
 
     def check_and_alert(
@@ -66,10 +101,11 @@ class ThresholdAlert:
 
         self._last_usage_pct = usage_pct
 
-        # Check each threshold
-        for threshold in self.THRESHOLDS:
-            if usage_pct >= threshold and threshold not in self._alerted_thresholds:
-                self._alerted_thresholds.add(threshold)
+        # Only the next pending threshold can be crossed
+        if self._next_idx < len(self.THRESHOLDS):
+            threshold = self.THRESHOLDS[self._next_idx]
+            if usage_pct >= threshold:
+                self._next_idx += 1
                 self._print_alert(threshold, tokens_used, token_limit, plan_name, time_left)
                 return threshold
 
@@ -101,22 +137,10 @@ class ThresholdAlert:
         token_limit_fmt = f"{token_limit:,}"
         tokens_display = f"{tokens_left_fmt} / {token_limit_fmt} tokens left"
 
-        # Build alert message based on threshold
-        if threshold >= 90:
-            color = "\033[91m"  # Bright red
-            message = "ALMOST OUT!"
-            suggestion = time_left if time_left else "Resets soon"
-        elif threshold >= 75:
-            color = "\033[38;5;208m"  # Orange (256-color)
-            message = "Running low"
-            suggestion = time_left if time_left else "Switch to Sonnet or run /compact"
-        else:  # 50%
-            color = "\033[93m"  # Bright yellow
-            message = "Halfway there"
-            suggestion = "Keep an eye on usage"
-
-        reset = "\033[0m"
-        dim = "\033[90m"
+        color, message, suggestion, show_time_left = _ALERT_STYLES[threshold]
+        if show_time_left and time_left:
+            suggestion = time_left
+        reset, dim = _RESET, _DIM
 
         # Build content lines with dynamic width (truncate if needed)
         header = self._truncate(f"{message} · {plan_display} · {threshold}% used", content_width)
@@ -124,16 +148,22 @@ class ThresholdAlert:
         suggestion = self._truncate(suggestion, content_width)
         chomp_line = self._truncate("Run `chomp` for details", content_width)
 
-        # Print the alert box (all in status color)
-        print(f"\n{color}╭{'─' * box_width}╮")
-        print(f"│  {header.ljust(content_width)}  │")
-        print(f"│  {dim}{tokens_display.ljust(content_width)}{reset}{color}  │")
-        print(f"│  {dim}{suggestion.ljust(content_width)}{reset}{color}  │")
-        print(f"│{' ' * box_width}│")
-        print(f"│  {dim}{chomp_line.ljust(content_width)}{reset}{color}  │")
-        print(f"╰{'─' * box_width}╯{reset}\n")
-
-        # Flush to ensure immediate display
+        top, bottom, blank = _box_borders(box_width)
+
+        # Write the alert box (all in status color) in one go
+        sys.stdout.write(
+            "\n".join(
+                (
+                    f"\n{color}{top}",
+                    f"│  {header.ljust(content_width)}  │",
+                    f"│  {dim}{tokens_display.ljust(content_width)}{reset}{color}  │",
+                    f"│  {dim}{suggestion.ljust(content_width)}{reset}{color}  │",
+                    blank,
+                    f"│  {dim}{chomp_line.ljust(content_width)}{reset}{color}  │",
+                    f"{bottom}{reset}\n\n",
+                )
+            )
+        )
         sys.stdout.flush()
 
 
@@ -4,11 +4,12 @@ Provides non-blocking keyboard polling for Y/N prompts during live monitoring.
 """
 
 import logging
-import select
+import selectors
+import shutil
 import subprocess
 import sys
 from dataclasses import dataclass, field
-from typing import Optional, Set
+from typing import Any, List, Optional, Set
 
 logger = logging.getLogger(__name__)
 
@@ -56,28 +57,74 @@ def get_action_state() -> ActionState:
     return _action_state
 
 
-def poll_keyboard(timeout: float = 0.1) -> Optional[str]:
+# Selector with stdin registered, created on first poll and kept for reuse
+_stdin_selector: Optional[selectors.BaseSelector] = None
+_selector_stream: Any = None
+
+
+def _get_stdin_selector() -> selectors.BaseSelector:
+    """Return the shared selector watching the current sys.stdin."""
+    global _stdin_selector, _selector_stream
+    if _stdin_selector is None or _selector_stream is not sys.stdin:
+        if _stdin_selector is not None:
+            _stdin_selector.close()
+        _stdin_selector = selectors.DefaultSelector()
+        _stdin_selector.register(sys.stdin, selectors.EVENT_READ)
+        _selector_stream = sys.stdin
+    return _stdin_selector
+
+
+def keyboard_available() -> bool:
+    """Check whether keypresses can be read from an interactive terminal."""
+    return HAS_TERMIOS and sys.stdin.isatty()
+
+
+def poll_keyboard(timeout: Optional[float] = 0.1) -> Optional[str]:
     """Poll for keyboard input without blocking.
 
     Args:
-        timeout: How long to wait for input (seconds)
+        timeout: How long to wait for input (seconds), or None to block
+            until a key arrives
 
     Returns:
         The key pressed (lowercase) or None if no input
+
+    Raises:
+        EOFError: If stdin reached end of file or can no longer be read,
+            so further polls would return immediately
     """
-    if not HAS_TERMIOS or not sys.stdin.isatty():
+    if not keyboard_available():
         return None
 
     try:
         # Check if input is available
-        ready, _, _ = select.select([sys.stdin], [], [], timeout)
-        if ready:
-            char = sys.stdin.read(1)
-            return char.lower() if char else None
+        if not _get_stdin_selector().select(timeout):
+            return None
+        char = sys.stdin.read(1)
     except Exception as e:
         logger.debug(f"Keyboard poll error: {e}")
+        raise EOFError(f"stdin is unreadable: {e}") from e
 
-    return None
+    if not char:
+        raise EOFError("stdin reached end of file")
+    return char.lower()
+
+
+def spawn_claude(args: List[str]) -> None:
+    """Start the claude CLI with args in the background, without waiting.
+
+    Raises:
+        OSError: If the command cannot be started
+    """
+    # An absolute executable with close_fds=False lets CPython start the
+    # child with posix_spawn/vfork instead of forking this process
+    executable = shutil.which("claude") or "claude"
+    subprocess.Popen(
+        [executable, *args],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        close_fds=False,
+    )
 
 
 def execute_action(action: str) -> bool:
@@ -100,11 +147,7 @@ def execute_action(action: str) -> bool:
         logger.info(f"Executing action: {cmd}")
 
         # Run in background, don't wait
-        subprocess.Popen(
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
+        spawn_claude(cmd[1:])
         return True
     except Exception as e:
         logger.warning(f"Failed to execute action '{action}': {e}")
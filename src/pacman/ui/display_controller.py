@@ -4,18 +4,24 @@ Orchestrates UI components and coordinates display updates.
 """
 
 import logging
+import re
+import sys
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
 import pytz
 from rich.console import Console, Group, RenderableType
 from rich.live import Live
+from rich.style import Style
 from rich.text import Text
 
 from pacman.core.calculations import calculate_hourly_burn_rate
 from pacman.core.models import normalize_model_name
 from pacman.core.plans import Plans
+from pacman.terminal.themes import get_themed_console
 from pacman.ui.components import (
     AdvancedCustomLimitDisplay,
     ErrorDisplayComponent,
@@ -33,6 +39,71 @@ from pacman.utils.time_utils import (
 )
 
 
+# Minimum seconds between logging the same render error twice
+ERROR_LOG_INTERVAL_SECONDS = 60.0
+
+# Model families collapsed into a single bucket in the simple display
+_MODEL_BUCKETS: Tuple[str, ...] = ("sonnet", "opus", "haiku")
+
+
+@lru_cache(maxsize=64)
+def _normalized(model: str) -> str:
+    """Memoized normalize_model_name for the small set of per-frame model names."""
+    return normalize_model_name(model)
+
+
+def _blocks_signature(blocks: List[Any]) -> Tuple[Any, ...]:
+    """Per-block (id, totalTokens, isActive) signature of the block list."""
+    return tuple(
+        (b.get("id"), b.get("totalTokens"), b.get("isActive"))
+        for b in blocks
+        if isinstance(b, dict)
+    )
+
+
+def _active_block_signature(active_block: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Signature of the active block fields shown on the session screen."""
+    per_model_stats = active_block.get("perModelStats") or {}
+    return (
+        active_block.get("billableTokens"),
+        active_block.get("totalTokens"),
+        active_block.get("costUSD"),
+        active_block.get("sentMessagesCount"),
+        len(active_block.get("entries") or ()),
+        active_block.get("startTime"),
+        active_block.get("endTime"),
+        tuple(
+            (model, tuple(stats.items()) if isinstance(stats, dict) else stats)
+            for model, stats in per_model_stats.items()
+        ),
+    )
+
+
+def _find_clock_line(screen_buffer: List[Any], time_str: str) -> Optional[int]:
+    """Index of the "⏰ <time>" status line showing time_str, if any."""
+    if not time_str:
+        return None
+    for index in range(len(screen_buffer) - 1, -1, -1):
+        line = screen_buffer[index]
+        if isinstance(line, str) and line.startswith("⏰") and time_str in line:
+            return index
+    return None
+
+
+# Shared notification config directory
+_config_dir: Optional[Path] = None
+
+
+def get_config_dir() -> Path:
+    """Get the notification config directory, creating it on first use."""
+    global _config_dir
+    if _config_dir is None:
+        config_dir = Path.home() / ".claude" / "config"
+        config_dir.mkdir(parents=True, exist_ok=True)
+        _config_dir = config_dir
+    return _config_dir
+
+
 class DisplayController:
     """Main controller for coordinating UI display operations."""
 
@@ -52,9 +123,17 @@ class DisplayController:
         self.advanced_custom_display = None
         self.buffer_manager = ScreenBufferManager()
         self.session_calculator = SessionCalculator()
-        config_dir = Path.home() / ".claude" / "config"
-        config_dir.mkdir(parents=True, exist_ok=True)
-        self.notification_manager = NotificationManager(config_dir)
+        self.notification_manager = NotificationManager(get_config_dir())
+        self._tz_handler_cache: Dict[str, TimezoneHandler] = {}
+        self._pytz_cache: Dict[str, Any] = {}
+        self._render_key: Optional[Tuple[Any, ...]] = None
+        self._last_error: Optional[str] = None
+        self._plan_cache: Dict[str, Tuple[bool, float, int]] = {}
+        self._burn_rate_key: Optional[Tuple[int, int, Any, datetime]] = None
+        self._burn_rate = 0.0
+        self._last_error_time = 0.0
+        # (screen buffer, clock text, clock line index, no_motion)
+        self._render_cache: Optional[Tuple[List[str], str, Optional[int], bool]] = None
 
     def _extract_session_data(self, active_block: Dict[str, Any]) -> Dict[str, Any]:
         """Extract basic session data from active block."""
@@ -70,6 +149,43 @@ class DisplayController:
             "end_time_str": active_block.get("endTime"),
         }
 
+    def _plan_meta(self, plan: str) -> Tuple[bool, float, int]:
+        """Get (is_valid, cost_limit, message_limit) for a plan, cached per name."""
+        meta = self._plan_cache.get(plan)
+        if meta is None:
+            from pacman.core.plans import get_cost_limit
+
+            meta = (
+                Plans.is_valid_plan(plan),
+                get_cost_limit(plan),
+                Plans.get_message_limit(plan),
+            )
+            self._plan_cache[plan] = meta
+        return meta
+
+    def _get_burn_rate(
+        self, blocks: List[Dict[str, Any]], current_time: datetime
+    ) -> float:
+        """Get the hourly burn rate, memoized per block list and minute.
+
+        New blocks change the list length, but the active block's totalTokens
+        also grows in place between refreshes, so it is part of the key too.
+        """
+        minute = current_time.replace(second=0, microsecond=0)
+        active_tokens = next(
+            (
+                b.get("totalTokens")
+                for b in blocks
+                if isinstance(b, dict) and b.get("isActive")
+            ),
+            None,
+        )
+        key = (id(blocks), len(blocks), active_tokens, minute)
+        if key != self._burn_rate_key:
+            self._burn_rate = calculate_hourly_burn_rate(blocks, current_time)
+            self._burn_rate_key = key
+        return self._burn_rate
+
     def _calculate_token_limits(self, args: Any, token_limit: int) -> Tuple[int, int]:
         """Calculate token limits based on plan and arguments."""
         if (
@@ -95,7 +211,8 @@ class DisplayController:
     ) -> Dict[str, Any]:
         """Calculate cost-related predictions."""
         # Determine cost limit based on plan
-        if Plans.is_valid_plan(args.plan) and cost_limit_p90 is not None:
+        is_valid_plan = self._plan_meta(args.plan)[0]
+        if is_valid_plan and cost_limit_p90 is not None:
             cost_limit = cost_limit_p90
         else:
             cost_limit = 100.0  # Default
@@ -115,47 +232,56 @@ class DisplayController:
     ) -> Dict[str, bool]:
         """Check and update notification states."""
         notifications = {}
+        checks = (
+            (
+                "switch_to_custom",
+                token_limit > original_limit,
+                "show_switch_notification",
+            ),
+            ("exceed_max_limit", session_cost > cost_limit, "show_exceed_notification"),
+            (
+                "cost_will_exceed",
+                predicted_end_time < reset_time,
+                "show_cost_will_exceed",
+            ),
+        )
 
-        # Switch to custom notification
-        switch_condition = token_limit > original_limit
-        if switch_condition and self.notification_manager.should_notify(
-            "switch_to_custom"
-        ):
-            self.notification_manager.mark_notified("switch_to_custom")
-            notifications["show_switch_notification"] = True
-        else:
-            notifications["show_switch_notification"] = (
-                switch_condition
-                and self.notification_manager.is_notification_active("switch_to_custom")
-            )
+        for key, condition, out_key in checks:
+            if not condition:
+                notifications[out_key] = False
+                continue
+            should_notify, is_active = self.notification_manager.get_state(key)
+            if should_notify:
+                self.notification_manager.mark_notified(key)
+            notifications[out_key] = should_notify or is_active
 
-        # Exceed limit notification
-        exceed_condition = session_cost > cost_limit
-        if exceed_condition and self.notification_manager.should_notify(
-            "exceed_max_limit"
-        ):
-            self.notification_manager.mark_notified("exceed_max_limit")
-            notifications["show_exceed_notification"] = True
-        else:
-            notifications["show_exceed_notification"] = (
-                exceed_condition
-                and self.notification_manager.is_notification_active("exceed_max_limit")
-            )
+        return notifications
 
-        # Cost will exceed notification
-        run_out_condition = predicted_end_time < reset_time
-        if run_out_condition and self.notification_manager.should_notify(
-            "cost_will_exceed"
+    def _should_log_error(self, error_key: str) -> bool:
+        """Rate-limit repeated identical errors from the refresh loop."""
+        now = time.monotonic()
+        if (
+            error_key == self._last_error
+            and now - self._last_error_time < ERROR_LOG_INTERVAL_SECONDS
         ):
-            self.notification_manager.mark_notified("cost_will_exceed")
-            notifications["show_cost_will_exceed"] = True
-        else:
-            notifications["show_cost_will_exceed"] = (
-                run_out_condition
-                and self.notification_manager.is_notification_active("cost_will_exceed")
-            )
+            return False
+        self._last_error = error_key
+        self._last_error_time = now
+        return True
 
-        return notifications
+    def _get_display_tz(self, tz_name: str) -> Any:
+        """Return a cached pytz timezone, falling back to Europe/Warsaw."""
+        try:
+            return self._pytz_cache[tz_name]
+        except KeyError:
+            pass
+
+        try:
+            display_tz = pytz.timezone(tz_name)
+        except pytz.exceptions.UnknownTimeZoneError:
+            display_tz = self._get_display_tz("Europe/Warsaw")
+        self._pytz_cache[tz_name] = display_tz
+        return display_tz
 
     def _format_display_times(
         self,
@@ -165,7 +291,10 @@ class DisplayController:
         reset_time: datetime,
     ) -> Dict[str, str]:
         """Format times for display."""
-        tz_handler = TimezoneHandler(default_tz="Europe/Warsaw")
+        tz_handler = self._tz_handler_cache.get("Europe/Warsaw")
+        if tz_handler is None:
+            tz_handler = TimezoneHandler(default_tz="Europe/Warsaw")
+            self._tz_handler_cache["Europe/Warsaw"] = tz_handler
         timezone_to_use = (
             args.timezone
             if tz_handler.validate_timezone(args.timezone)
@@ -187,11 +316,8 @@ class DisplayController:
             reset_time_local, time_format, include_seconds=False
         )
 
-        # Current time display
-        try:
-            display_tz = pytz.timezone(args.timezone)
-        except pytz.exceptions.UnknownTimeZoneError:
-            display_tz = pytz.timezone("Europe/Warsaw")
+        # Current time display (zoneinfo lookups are cached per timezone name)
+        display_tz = self._get_display_tz(args.timezone)
 
         current_time_display = current_time.astimezone(display_tz)
         current_time_str = format_display_time(
@@ -239,12 +365,28 @@ class DisplayController:
             )
             return self.buffer_manager.create_screen_renderable(screen_buffer)
 
+        burn_rate = self._get_burn_rate(data["blocks"], current_time)
+
         # Use simplified display if enabled
         if self.use_simple_display:
-            return self._create_simple_display(active_block, data, args, token_limit, current_time)
+            return self._create_simple_display(
+                active_block, data, args, token_limit, current_time, burn_rate
+            )
+
+        # Reuse the last screen when nothing but the clock has changed
+        render_key = (
+            _blocks_signature(data["blocks"]),
+            _active_block_signature(active_block),
+            burn_rate,
+            args.plan,
+            args.timezone,
+            token_limit,
+            current_time.replace(second=0, microsecond=0),
+        )
+        if render_key == self._render_key and self._render_cache is not None:
+            return self._render_from_cache(args, current_time)
 
-        cost_limit_p90 = None
-        messages_limit_p90 = None
+        is_valid_plan, cost_limit_p90, messages_limit_p90 = self._plan_meta(args.plan)
 
         if args.plan == "custom":
             temp_display = AdvancedCustomLimitDisplay(None)
@@ -254,30 +396,30 @@ class DisplayController:
             )
             cost_limit_p90 = percentiles["costs"]["p90"]
             messages_limit_p90 = percentiles["messages"]["p90"]
-        else:
-            # Use centralized cost limits
-            from pacman.core.plans import get_cost_limit
-
-            cost_limit_p90 = get_cost_limit(args.plan)
-
-            messages_limit_p90 = Plans.get_message_limit(args.plan)
 
         # Process active session data with cost limit
         try:
             processed_data = self._process_active_session_data(
-                active_block, data, args, token_limit, current_time, cost_limit_p90
+                active_block,
+                data,
+                args,
+                token_limit,
+                current_time,
+                cost_limit_p90,
+                burn_rate,
             )
         except Exception as e:
             # Log the error and show error screen
             logger = logging.getLogger(__name__)
-            logger.error(f"Error processing active session data: {e}", exc_info=True)
+            if self._should_log_error(f"process:{type(e).__name__}:{e}"):
+                logger.error(f"Error processing active session data: {e}", exc_info=True)
             screen_buffer = self.error_display.format_error_screen(
                 args.plan, args.timezone
             )
             return self.buffer_manager.create_screen_renderable(screen_buffer)
 
         # Add P90 limits to processed data for display
-        if Plans.is_valid_plan(args.plan):
+        if is_valid_plan:
             processed_data["cost_limit_p90"] = cost_limit_p90
             processed_data["messages_limit_p90"] = messages_limit_p90
 
@@ -286,33 +428,51 @@ class DisplayController:
                 **processed_data
             )
         except Exception as e:
-            # Log the error with more details
+            # Log the error once per interval; dump field types only at DEBUG
             logger = logging.getLogger(__name__)
-            logger.error(f"Error in format_active_session_screen: {e}", exc_info=True)
-            logger.exception(f"processed_data type: {type(processed_data)}")
-            if isinstance(processed_data, dict):
-                for key, value in processed_data.items():
-                    if key == "per_model_stats":
-                        logger.exception(f"  {key}: {type(value).__name__}")
-                        if isinstance(value, dict):
-                            for model, stats in value.items():
-                                logger.exception(
-                                    f"    {model}: {type(stats).__name__} = {stats}"
-                                )
-                        else:
-                            logger.exception(f"    value = {value}")
-                    elif key == "entries":
-                        logger.exception(
-                            f"  {key}: {type(value).__name__} with {len(value) if isinstance(value, list) else 'N/A'} items"
-                        )
-                    else:
-                        logger.exception(f"  {key}: {type(value).__name__} = {value}")
+            if self._should_log_error(f"format:{type(e).__name__}:{e}"):
+                logger.error(f"Error in format_active_session_screen: {e}", exc_info=True)
+                if logger.isEnabledFor(logging.DEBUG) and isinstance(processed_data, dict):
+                    logger.debug(
+                        "processed_data snapshot: %s",
+                        {k: type(v).__name__ for k, v in processed_data.items()},
+                    )
             screen_buffer = self.error_display.format_error_screen(
                 args.plan, args.timezone
             )
             return self.buffer_manager.create_screen_renderable(screen_buffer)
 
         no_motion = processed_data.get("no_motion", False)
+        current_time_str = processed_data.get("current_time_str", "")
+        self._render_key = render_key
+        self._render_cache = (
+            screen_buffer,
+            current_time_str,
+            _find_clock_line(screen_buffer, current_time_str),
+            no_motion,
+        )
+        return self.buffer_manager.create_screen_renderable(screen_buffer, no_motion=no_motion)
+
+    def _render_from_cache(self, args: Any, current_time: datetime) -> RenderableType:
+        """Re-render the cached screen buffer with a refreshed clock."""
+        screen_buffer, cached_time_str, clock_index, no_motion = self._render_cache
+        current_time_str = format_display_time(
+            current_time.astimezone(self._get_display_tz(args.timezone)),
+            get_time_format_preference(args),
+            include_seconds=True,
+        )
+        if clock_index is not None and current_time_str != cached_time_str:
+            # Only the clock line changes; other fields may show the same time
+            screen_buffer = list(screen_buffer)
+            screen_buffer[clock_index] = screen_buffer[clock_index].replace(
+                cached_time_str, current_time_str, 1
+            )
+            self._render_cache = (
+                screen_buffer,
+                current_time_str,
+                clock_index,
+                no_motion,
+            )
         return self.buffer_manager.create_screen_renderable(screen_buffer, no_motion=no_motion)
 
     def _create_simple_display(
@@ -322,6 +482,7 @@ class DisplayController:
         args: Any,
         token_limit: int,
         current_time: datetime,
+        burn_rate: Optional[float] = None,
     ) -> RenderableType:
         """Create the simplified human-first display.
 
@@ -331,6 +492,7 @@ class DisplayController:
             args: Command line arguments
             token_limit: Current token limit
             current_time: Current UTC time
+            burn_rate: Precomputed hourly burn rate for this frame
 
         Returns:
             Rich Panel renderable
@@ -349,45 +511,39 @@ class DisplayController:
         )
         minutes_to_reset = time_data.get("minutes_to_reset", 300)
 
-        # Calculate model distribution
-        model_distribution = {}
-        total_tokens = 0
-        for model, stats in per_model_stats.items():
-            if isinstance(stats, dict):
-                model_tokens = stats.get("input_tokens", 0) + stats.get("output_tokens", 0)
-                total_tokens += model_tokens
-
-        if total_tokens > 0:
+        # Calculate model distribution; brand-new sessions have no stats yet
+        model_distribution: Dict[str, float] = {}
+        if per_model_stats:
+            # Sum input/output tokens per model in a single pass
+            raw_totals: Dict[str, int] = {}
+            total_tokens = 0
             for model, stats in per_model_stats.items():
-                if isinstance(stats, dict):
-                    model_tokens = stats.get("input_tokens", 0) + stats.get("output_tokens", 0)
-                    normalized = normalize_model_name(model)
+                if not isinstance(stats, dict):
+                    continue
+                model_tokens = stats.get("input_tokens", 0) + stats.get(
+                    "output_tokens", 0
+                )
+                if model_tokens:
+                    raw_totals[model] = model_tokens
+                    total_tokens += model_tokens
+
+            if total_tokens > 0:
+                for model, model_tokens in raw_totals.items():
+                    normalized = _normalized(model)
                     # Simplify to just "sonnet" or "opus"
-                    if "sonnet" in normalized.lower():
-                        key = "sonnet"
-                    elif "opus" in normalized.lower():
-                        key = "opus"
-                    elif "haiku" in normalized.lower():
-                        key = "haiku"
-                    else:
-                        key = normalized
-                    model_distribution[key] = model_distribution.get(key, 0) + (model_tokens / total_tokens * 100)
+                    normalized_lower = normalized.lower()
+                    key = normalized
+                    for bucket in _MODEL_BUCKETS:
+                        if bucket in normalized_lower:
+                            key = bucket
+                            break
+                    model_distribution[key] = model_distribution.get(key, 0) + (
+                        model_tokens / total_tokens * 100
+                    )
 
         # Calculate burn rate
-        burn_rate = calculate_hourly_burn_rate(data["blocks"], current_time)
-
-        # Calculate output ratio
-        total_input = sum(
-            stats.get("input_tokens", 0)
-            for stats in per_model_stats.values()
-            if isinstance(stats, dict)
-        )
-        total_output = sum(
-            stats.get("output_tokens", 0)
-            for stats in per_model_stats.values()
-            if isinstance(stats, dict)
-        )
-        output_ratio = total_output / total_input if total_input > 0 else 1.0
+        if burn_rate is None:
+            burn_rate = self._get_burn_rate(data["blocks"], current_time)
 
         # Calculate usage over time (5hr window and weekly)
         usage_over_time = self._calculate_usage_over_time(
@@ -458,68 +614,97 @@ class DisplayController:
             "weekly": weekly_tokens,
         }
 
-    def _calculate_top_contributors(
-        self,
-        per_model_stats: Dict[str, Any],
-        entries: List[Dict[str, Any]],
-        limit: int = 5,
-    ) -> List[Dict[str, Any]]:
-        """Calculate top token contributors from session data.
+    def _summarize_models(
+        self, per_model_stats: Dict[str, Any], limit: int = 5
+    ) -> Tuple[Dict[str, float], List[Dict[str, Any]]]:
+        """Build model distribution and top contributors in a single pass.
 
         Estimates token attribution from available data sources:
         - Models: Which Claude model consumed tokens
-        - Messages: Individual API calls (grouped by message_id if available)
+
+        The distribution only counts input and output tokens of known models,
+        while contributors are ranked by all token types including cache.
 
         Args:
             per_model_stats: Per-model token statistics
-            entries: List of usage entries
             limit: Maximum number of contributors to return
 
         Returns:
-            List of contributor dicts with type, name, tokens, percentage
+            Tuple of (model distribution percentages, contributor dicts with
+            type, name, tokens, percentage)
         """
+        if not per_model_stats:
+            return {}, []
+
+        model_tokens: Dict[str, int] = {}
         contributors: List[Dict[str, Any]] = []
         total_tokens = 0
 
-        # Calculate total tokens from per_model_stats
         for model, stats in per_model_stats.items():
-            if isinstance(stats, dict):
-                model_tokens = (
-                    stats.get("input_tokens", 0)
-                    + stats.get("output_tokens", 0)
-                    + stats.get("cache_creation_tokens", 0)
-                    + stats.get("cache_read_tokens", 0)
-                )
-                total_tokens += model_tokens
+            if not isinstance(stats, dict):
+                continue
+            input_tokens = stats.get("input_tokens", 0)
+            output_tokens = stats.get("output_tokens", 0)
+            io_tokens = input_tokens + output_tokens
+            all_tokens = (
+                io_tokens
+                + stats.get("cache_creation_tokens", 0)
+                + stats.get("cache_read_tokens", 0)
+            )
+            total_tokens += all_tokens
+
+            normalized = _normalized(model)
+            if io_tokens > 0 and normalized and normalized != "unknown":
+                model_tokens[normalized] = model_tokens.get(normalized, 0) + io_tokens
+            if all_tokens > 0:
+                # Shorten model name for display
+                display_name = normalized.replace("claude-", "").replace("-", " ").title()
+                contributors.append({
+                    "type": "model",
+                    "name": display_name,
+                    "tokens": all_tokens,
+                    "input_tokens": input_tokens,
+                    "output_tokens": output_tokens,
+                })
 
-        if total_tokens == 0:
-            return []
+        # Calculate percentages based on current session total only
+        session_total_tokens = sum(model_tokens.values())
+        model_distribution = (
+            {
+                model: percentage(tokens, session_total_tokens)
+                for model, tokens in model_tokens.items()
+            }
+            if session_total_tokens
+            else {}
+        )
 
-        # Model-level attribution
-        for model, stats in per_model_stats.items():
-            if isinstance(stats, dict):
-                model_tokens = (
-                    stats.get("input_tokens", 0)
-                    + stats.get("output_tokens", 0)
-                    + stats.get("cache_creation_tokens", 0)
-                    + stats.get("cache_read_tokens", 0)
-                )
-                if model_tokens > 0:
-                    normalized = normalize_model_name(model)
-                    # Shorten model name for display
-                    display_name = normalized.replace("claude-", "").replace("-", " ").title()
-                    contributors.append({
-                        "type": "model",
-                        "name": display_name,
-                        "tokens": model_tokens,
-                        "percentage": (model_tokens / total_tokens) * 100,
-                        "input_tokens": stats.get("input_tokens", 0),
-                        "output_tokens": stats.get("output_tokens", 0),
-                    })
+        if total_tokens == 0:
+            return model_distribution, []
 
         # Sort by tokens descending and limit
         contributors.sort(key=lambda x: x["tokens"], reverse=True)
-        return contributors[:limit]
+        contributors = contributors[:limit]
+        for contributor in contributors:
+            contributor["percentage"] = (contributor["tokens"] / total_tokens) * 100
+        return model_distribution, contributors
+
+    def _calculate_top_contributors(
+        self,
+        per_model_stats: Dict[str, Any],
+        entries: List[Dict[str, Any]],
+        limit: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """Calculate top token contributors from session data.
+
+        Args:
+            per_model_stats: Per-model token statistics
+            entries: List of usage entries
+            limit: Maximum number of contributors to return
+
+        Returns:
+            List of contributor dicts with type, name, tokens, percentage
+        """
+        return self._summarize_models(per_model_stats, limit)[1]
 
     def _process_active_session_data(
         self,
@@ -529,6 +714,7 @@ class DisplayController:
         token_limit: int,
         current_time: datetime,
         cost_limit_p90: Optional[float] = None,
+        burn_rate: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Process active session data for display.
 
@@ -539,6 +725,7 @@ class DisplayController:
             token_limit: Current token limit
             current_time: Current UTC time
             cost_limit_p90: Optional cost limit
+            burn_rate: Precomputed hourly burn rate for this frame
 
         Returns:
             Processed data dictionary for display
@@ -546,17 +733,11 @@ class DisplayController:
         # Extract session data
         session_data = self._extract_session_data(active_block)
 
-        # Calculate model distribution
-        model_distribution = self._calculate_model_distribution(
+        # Calculate model distribution and top token contributors
+        model_distribution, top_contributors = self._summarize_models(
             session_data["raw_per_model_stats"]
         )
 
-        # Calculate top token contributors
-        top_contributors = self._calculate_top_contributors(
-            session_data["raw_per_model_stats"],
-            session_data["entries"],
-        )
-
         # Calculate token limits
         token_limit, original_limit = self._calculate_token_limits(args, token_limit)
 
@@ -571,7 +752,8 @@ class DisplayController:
         time_data = self._calculate_time_data(session_data, current_time)
 
         # Calculate burn rate
-        burn_rate = calculate_hourly_burn_rate(data["blocks"], current_time)
+        if burn_rate is None:
+            burn_rate = self._get_burn_rate(data["blocks"], current_time)
 
         # Calculate cost predictions
         cost_data = self._calculate_cost_predictions(
@@ -632,37 +814,7 @@ class DisplayController:
         Returns:
             Dictionary mapping model names to usage percentages for the current session
         """
-        if not raw_per_model_stats:
-            return {}
-
-        # Calculate total tokens per model for THIS SESSION ONLY
-        model_tokens = {}
-        for model, stats in raw_per_model_stats.items():
-            if isinstance(stats, dict):
-                # Normalize model name
-                normalized_model = normalize_model_name(model)
-                if normalized_model and normalized_model != "unknown":
-                    # Sum all token types for this model in current session
-                    total_tokens = stats.get("input_tokens", 0) + stats.get(
-                        "output_tokens", 0
-                    )
-                    if total_tokens > 0:
-                        if normalized_model in model_tokens:
-                            model_tokens[normalized_model] += total_tokens
-                        else:
-                            model_tokens[normalized_model] = total_tokens
-
-        # Calculate percentages based on current session total only
-        session_total_tokens = sum(model_tokens.values())
-        if session_total_tokens == 0:
-            return {}
-
-        model_distribution = {}
-        for model, tokens in model_tokens.items():
-            model_percentage = percentage(tokens, session_total_tokens)
-            model_distribution[model] = model_percentage
-
-        return model_distribution
+        return self._summarize_models(raw_per_model_stats)[0]
 
     def create_loading_display(
         self,
@@ -698,6 +850,17 @@ class DisplayController:
         screen_buffer = self.error_display.format_error_screen(plan, timezone)
         return self.buffer_manager.create_screen_renderable(screen_buffer)
 
+    def border_is_static(self, no_motion: bool = False) -> bool:
+        """Check whether every frame renders the same, unanimated border.
+
+        Args:
+            no_motion: Whether border animation is disabled
+
+        Returns:
+            True when animation is off or stdout is not a TTY
+        """
+        return get_pacman_border(no_motion).is_static
+
     def create_live_context(self) -> Live:
         """Create live display context manager.
 
@@ -716,6 +879,37 @@ class DisplayController:
         self.screen_manager.set_screen_dimensions(width, height)
 
 
+# DEC private mode 2026: hold painting until the whole frame has arrived
+_BEGIN_SYNCHRONIZED_UPDATE = "\x1b[?2026h"
+_END_SYNCHRONIZED_UPDATE = "\x1b[?2026l"
+
+
+class SynchronizedLive(Live):
+    """Live display that asks the terminal to paint each frame atomically.
+
+    Terminals without synchronized output support ignore the sequences.
+    """
+
+    def refresh(self) -> None:
+        """Refresh the display inside a synchronized update."""
+        console = self.console
+        if (
+            not console.is_terminal
+            or console.is_dumb_terminal
+            or console.legacy_windows
+        ):
+            super().refresh()
+            return
+
+        with self._lock:
+            console.file.write(_BEGIN_SYNCHRONIZED_UPDATE)
+            try:
+                super().refresh()
+            finally:
+                console.file.write(_END_SYNCHRONIZED_UPDATE)
+                console.file.flush()
+
+
 class LiveDisplayManager:
     """Manager for Rich Live display operations."""
 
@@ -734,6 +928,7 @@ class LiveDisplayManager:
         auto_refresh: bool = True,
         console: Optional[Console] = None,
         refresh_per_second: float = 0.75,
+        synchronized: bool = False,
     ) -> Live:
         """Create Rich Live display context.
 
@@ -741,13 +936,15 @@ class LiveDisplayManager:
             auto_refresh: Whether to auto-refresh
             console: Optional console instance
             refresh_per_second: Display refresh rate (0.1-20 Hz)
+            synchronized: Wrap each frame in a synchronized terminal update
 
         Returns:
             Rich Live context manager
         """
         display_console = console or self._console
 
-        self._live_context = Live(
+        live_class = SynchronizedLive if synchronized else Live
+        self._live_context = live_class(
             console=display_console,
             refresh_per_second=refresh_per_second,
             auto_refresh=auto_refresh,
@@ -757,6 +954,37 @@ class LiveDisplayManager:
         return self._live_context
 
 
+# SGR colour sequences, stripped when measuring bordered content
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+def _visible_len(text: str) -> int:
+    """Length of text as displayed, ignoring SGR colour sequences."""
+    if "\x1b" not in text:
+        return len(text)
+    return len(_ANSI_RE.sub("", text))
+
+
+# Border colour for Text renderables, equivalent to PacManBorder.YELLOW
+_YELLOW_STYLE = Style(color="yellow")
+
+# Upper bound on cached no-motion rows before the cache is reset
+_STATIC_ROW_CACHE_SIZE = 256
+
+
+def _bordered_text(left_char: str, content: str, right_char: str) -> Text:
+    """Wrap content between yellow side border characters."""
+    text = Text()
+    text.append(left_char, style=_YELLOW_STYLE)
+    text.append(content)
+    text.append(right_char, style=_YELLOW_STYLE)
+    return text
+
+
+# Pac-Man travel direction along each border edge
+_DIRECTIONS: Tuple[str, ...] = ("right", "down", "left", "up")
+
+
 class PacManBorder:
     """Pac-Man animated border around the dashboard.
 
@@ -785,6 +1013,26 @@ class PacManBorder:
     BIG_DOT = "●"
     SMALL_DOT = "•"
 
+    __slots__ = (
+        "_width",
+        "_height",
+        "_no_motion",
+        "_position",
+        "_mouth_open",
+        "_perimeter",
+        "_is_tty",
+        "_static_only",
+        "_big_row",
+        "_small_row",
+        "_pos_table",
+        "_static_top",
+        "_static_bottom",
+        "_static_top_line",
+        "_static_bottom_line",
+        "_row_cache",
+        "_static_rows",
+    )
+
     def __init__(self, width: int = 70, height: int = 30, no_motion: bool = False):
         self._width = width
         self._height = height
@@ -792,117 +1040,254 @@ class PacManBorder:
         self._position = 0
         self._mouth_open = True
         self._perimeter = 2 * (width - 2) + 2 * (height - 2)
+        # Full-length dot rows; animated frames are sliced out of these
+        self._big_row = self.BIG_DOT * (width - 2)
+        self._small_row = self.SMALL_DOT * (width - 2)
         try:
-            import sys
             self._is_tty = sys.stdout.isatty()
         except Exception:
             self._is_tty = False
+        self._static_only = no_motion or not self._is_tty
+        self._pos_table = [self._compute_border_char(p) for p in range(self._perimeter)]
+        # Animated top/bottom rows keyed by (is_top, position, mouth_open);
+        # bounded by the perimeter, so it fills after one lap
+        self._row_cache: Dict[Tuple[bool, int, bool], str] = {}
+        # Bordered no-motion rows keyed by their content
+        self._static_rows: Dict[str, Text] = {}
+        # Static borders, shared by every no-motion frame
+        horizontal = self.HORIZONTAL * (width - 2)
+        self._static_top_line = (
+            f"{self.YELLOW}{self.TOP_LEFT}{horizontal}{self.TOP_RIGHT}{self.RESET}"
+        )
+        self._static_bottom_line = (
+            f"{self.YELLOW}{self.BOTTOM_LEFT}{horizontal}"
+            f"{self.BOTTOM_RIGHT}{self.RESET}"
+        )
+        self._static_top = Text(
+            self.TOP_LEFT + horizontal + self.TOP_RIGHT, style=_YELLOW_STYLE
+        )
+        self._static_bottom = Text(
+            self.BOTTOM_LEFT + horizontal + self.BOTTOM_RIGHT, style=_YELLOW_STYLE
+        )
 
-    def _get_border_char(self, pos: int) -> tuple:
-        """Get position info for a border position.
+    @property
+    def is_static(self) -> bool:
+        """Whether every frame renders the same border (no motion or no TTY)."""
+        return self._static_only
 
-        Returns: (row, col, direction) where direction is 'right', 'down', 'left', 'up'
-        """
+    def _compute_border_char(self, pos: int) -> tuple:
+        """Compute position info for a border position."""
         w, h = self._width - 2, self._height - 2
 
         if pos < w:  # Top edge (left to right)
-            return (0, pos + 1, 'right')
+            return (0, pos + 1, _DIRECTIONS[0])
         elif pos < w + h:  # Right edge (top to bottom)
-            return (pos - w + 1, self._width - 1, 'down')
+            return (pos - w + 1, self._width - 1, _DIRECTIONS[1])
         elif pos < 2 * w + h:  # Bottom edge (right to left)
-            return (self._height - 1, self._width - 2 - (pos - w - h), 'left')
+            return (self._height - 1, self._width - 2 - (pos - w - h), _DIRECTIONS[2])
         else:  # Left edge (bottom to top)
-            return (self._height - 2 - (pos - 2 * w - h), 0, 'up')
+            return (self._height - 2 - (pos - 2 * w - h), 0, _DIRECTIONS[3])
+
+    def _get_border_char(self, pos: int) -> tuple:
+        """Get position info for a border position.
+
+        Returns: (row, col, direction) where direction is 'right', 'down', 'left', 'up'
+        """
+        return self._pos_table[pos]
 
     def advance(self) -> None:
-        """Advance animation to next frame."""
-        if self._no_motion or not self._is_tty:
+        """Advance animation to next frame; static borders never move."""
+        if self._static_only:
             return
         self._position = (self._position + 1) % self._perimeter
         self._mouth_open = not self._mouth_open
 
-    def render_top(self) -> str:
-        """Render top border line."""
-        if self._no_motion or not self._is_tty:
-            return f"{self.YELLOW}{self.TOP_LEFT}{self.HORIZONTAL * (self._width - 2)}{self.TOP_RIGHT}{self.RESET}"
-
-        parts = [f"{self.YELLOW}{self.TOP_LEFT}"]
-        w = self._width - 2
-
-        for i in range(w):
-            pos = i
-            if pos == self._position:
+    def _top_body(self) -> str:
+        """Dot row for the animated top border."""
+        key = (True, self._position, self._mouth_open)
+        body = self._row_cache.get(key)
+        if body is None:
+            pos = self._position
+            if pos < self._width - 2:
                 pac = self.PAC_RIGHT if self._mouth_open else self.PAC_CLOSED
-                parts.append(pac)
-            elif pos < self._position:
-                parts.append(self.SMALL_DOT)
+                body = self._small_row[:pos] + pac + self._big_row[pos + 1 :]
+            else:
+                body = self._small_row
+            self._row_cache[key] = body
+        return body
+
+    def _bottom_body(self) -> str:
+        """Dot row for the animated bottom border."""
+        key = (False, self._position, self._mouth_open)
+        body = self._row_cache.get(key)
+        if body is None:
+            w, h = self._width - 2, self._height - 2
+            # Bottom edge is traversed right to left, starting after the right edge
+            k = self._position - (w + h)
+            if k < 0:
+                body = self._big_row
+            elif k < w:
+                col = w - 1 - k
+                pac = self.PAC_LEFT if self._mouth_open else self.PAC_CLOSED
+                body = self._big_row[:col] + pac + self._small_row[col + 1 :]
             else:
-                parts.append(self.BIG_DOT)
+                body = self._small_row
+            self._row_cache[key] = body
+        return body
 
-        parts.append(f"{self.TOP_RIGHT}{self.RESET}")
-        return "".join(parts)
+    def _side_chars(self, row: int) -> Tuple[str, str]:
+        """Left and right border characters for a middle row."""
+        if self._static_only:
+            return self.VERTICAL, self.VERTICAL
 
-    def render_middle(self, content: str, row: int) -> str:
-        """Render a middle row with left and right borders."""
         w, h = self._width - 2, self._height - 2
+        BIG = self.BIG_DOT
+        SMALL = self.SMALL_DOT
+        PAC_C = self.PAC_CLOSED
+        pos = self._position
+        mo = self._mouth_open
+
+        # Left border
+        left_pos = (2 * w + h + (h - row)) % self._perimeter
+        if left_pos == pos:
+            left_char = self.PAC_UP if mo else PAC_C
+        elif left_pos > pos or pos > 2 * w + h:
+            left_char = BIG
+        else:
+            left_char = SMALL
 
-        # Left border position
-        left_pos = 2 * w + h + (h - row)
-        # Right border position
+        # Right border
         right_pos = w + row
-
-        if self._no_motion or not self._is_tty:
-            left_char = self.VERTICAL
-            right_char = self.VERTICAL
+        if right_pos == pos:
+            right_char = self.PAC_DOWN if mo else PAC_C
+        elif right_pos < pos:
+            right_char = SMALL
         else:
-            # Left border
-            if left_pos % self._perimeter == self._position:
-                left_char = self.PAC_UP if self._mouth_open else self.PAC_CLOSED
-            elif left_pos % self._perimeter > self._position or self._position > 2 * w + h:
-                left_char = self.BIG_DOT
-            else:
-                left_char = self.SMALL_DOT
+            right_char = BIG
 
-            # Right border
-            if right_pos == self._position:
-                right_char = self.PAC_DOWN if self._mouth_open else self.PAC_CLOSED
-            elif right_pos < self._position:
-                right_char = self.SMALL_DOT
-            else:
-                right_char = self.BIG_DOT
-
-        # Pad content to width
-        visible_len = len(content.encode('utf-8').decode('utf-8'))
-        # Strip ANSI codes for length calculation
-        import re
-        stripped = re.sub(r'\x1b\[[0-9;]*m', '', content)
-        padding = self._width - 2 - len(stripped)
+        return left_char, right_char
+
+    def _pad_content(self, content: str) -> str:
+        """Pad content to the inner border width."""
+        padding = self._width - 2 - _visible_len(content)
         if padding > 0:
             content = content + " " * padding
+        return content
 
-        return f"{self.YELLOW}{left_char}{self.RESET}{content}{self.YELLOW}{right_char}{self.RESET}"
+    def render_top(self) -> str:
+        """Render top border line."""
+        if self._static_only:
+            return self._static_top_line
+        return (
+            f"{self.YELLOW}{self.TOP_LEFT}{self._top_body()}"
+            f"{self.TOP_RIGHT}{self.RESET}"
+        )
+
+    def render_middle(self, content: str, row: int) -> str:
+        """Render a middle row with left and right borders."""
+        YELLOW = self.YELLOW
+        RESET = self.RESET
+        left_char, right_char = self._side_chars(row)
+        content = self._pad_content(content)
+        return f"{YELLOW}{left_char}{RESET}{content}{YELLOW}{right_char}{RESET}"
 
     def render_bottom(self) -> str:
         """Render bottom border line."""
-        if self._no_motion or not self._is_tty:
-            return f"{self.YELLOW}{self.BOTTOM_LEFT}{self.HORIZONTAL * (self._width - 2)}{self.BOTTOM_RIGHT}{self.RESET}"
+        if self._static_only:
+            return self._static_bottom_line
+        return (
+            f"{self.YELLOW}{self.BOTTOM_LEFT}{self._bottom_body()}"
+            f"{self.BOTTOM_RIGHT}{self.RESET}"
+        )
 
-        parts = [f"{self.YELLOW}{self.BOTTOM_LEFT}"]
-        w, h = self._width - 2, self._height - 2
-        bottom_start = w + h
+    def render_top_text(self) -> Text:
+        """Render top border line as a styled Text."""
+        if self._static_only:
+            return self._static_top
+        return Text(
+            self.TOP_LEFT + self._top_body() + self.TOP_RIGHT, style=_YELLOW_STYLE
+        )
 
-        for i in range(w):
-            pos = bottom_start + (w - 1 - i)
-            if pos == self._position:
-                pac = self.PAC_LEFT if self._mouth_open else self.PAC_CLOSED
-                parts.append(pac)
-            elif pos < self._position:
-                parts.append(self.SMALL_DOT)
+    def render_middle_text(self, content: str, row: int) -> Text:
+        """Render a middle row as Text with styled side borders."""
+        left_char, right_char = self._side_chars(row)
+        return _bordered_text(left_char, self._pad_content(content), right_char)
+
+    def render_bottom_text(self) -> Text:
+        """Render bottom border line as a styled Text."""
+        if self._static_only:
+            return self._static_bottom
+        return Text(
+            self.BOTTOM_LEFT + self._bottom_body() + self.BOTTOM_RIGHT,
+            style=_YELLOW_STYLE,
+        )
+
+    def render_frame(self, lines: List[Any]) -> List[Any]:
+        """Render the full bordered frame in a single pass.
+
+        Args:
+            lines: Screen lines; non-string renderables pass through unbordered
+
+        Returns:
+            Top border, bordered rows and bottom border as Rich renderables
+        """
+        inner_width = self._width - 2
+        static = self._static_only
+        if static:
+            VERTICAL = self.VERTICAL
+            static_rows = self._static_rows
+        else:
+            w, h = inner_width, self._height - 2
+            pos = self._position
+            perimeter = self._perimeter
+            left_base = 2 * w + 2 * h
+            past_left = pos > 2 * w + h
+            pac_left = self.PAC_UP if self._mouth_open else self.PAC_CLOSED
+            pac_right = self.PAC_DOWN if self._mouth_open else self.PAC_CLOSED
+            BIG = self.BIG_DOT
+            SMALL = self.SMALL_DOT
+
+        frame: List[Any] = [self.render_top_text()]
+        append = frame.append
+        for row, line in enumerate(lines, 1):
+            if not isinstance(line, str):
+                append(line)
+                continue
+
+            if static:
+                # Static rows depend only on their content, so reuse them
+                text = static_rows.get(line)
+                if text is None:
+                    if len(static_rows) >= _STATIC_ROW_CACHE_SIZE:
+                        static_rows.clear()
+                    text = _bordered_text(VERTICAL, self._pad_content(line), VERTICAL)
+                    static_rows[line] = text
+                append(text)
+                continue
+
+            left_pos = (left_base - row) % perimeter
+            if left_pos == pos:
+                left_char = pac_left
+            elif left_pos > pos or past_left:
+                left_char = BIG
+            else:
+                left_char = SMALL
+
+            right_pos = w + row
+            if right_pos == pos:
+                right_char = pac_right
+            elif right_pos < pos:
+                right_char = SMALL
             else:
-                parts.append(self.BIG_DOT)
+                right_char = BIG
+
+            padding = inner_width - _visible_len(line)
+            if padding > 0:
+                line += " " * padding
+            append(_bordered_text(left_char, line, right_char))
 
-        parts.append(f"{self.BOTTOM_RIGHT}{self.RESET}")
-        return "".join(parts)
+        append(self.render_bottom_text())
+        return frame
 
 
 # Shared border instance
@@ -936,29 +1321,12 @@ class ScreenBufferManager:
         Returns:
             Rich Group renderable
         """
-        from pacman.terminal.themes import get_themed_console
-
         if self.console is None:
             self.console = get_themed_console()
 
         border = get_pacman_border(no_motion)
 
-        text_objects = []
-
-        # Top border
-        text_objects.append(Text(border.render_top()))
-
-        # Content with side borders
-        for idx, line in enumerate(screen_buffer):
-            if isinstance(line, str):
-                # Strip Rich markup for border wrapping, then re-add
-                bordered_line = border.render_middle(line, idx + 1)
-                text_objects.append(Text(bordered_line))
-            else:
-                text_objects.append(line)
-
-        # Bottom border
-        text_objects.append(Text(border.render_bottom()))
+        text_objects = border.render_frame(screen_buffer)
 
         # Advance animation for next frame
         border.advance()
@@ -966,14 +1334,25 @@ class ScreenBufferManager:
         return Group(*text_objects)
 
 
+# Shared screen buffer manager for the legacy entry point
+_screen_buffer_manager: Optional[ScreenBufferManager] = None
+
+
+def get_screen_buffer_manager() -> ScreenBufferManager:
+    """Get or create the shared screen buffer manager instance."""
+    global _screen_buffer_manager
+    if _screen_buffer_manager is None:
+        _screen_buffer_manager = ScreenBufferManager()
+    return _screen_buffer_manager
+
+
 # Legacy functions for backward compatibility
 def create_screen_renderable(screen_buffer: List[str]) -> Group:
     """Legacy function - create screen renderable.
 
     Maintained for backward compatibility.
     """
-    manager = ScreenBufferManager()
-    return manager.create_screen_renderable(screen_buffer)
+    return get_screen_buffer_manager().create_screen_renderable(screen_buffer)
 
 
 class SessionCalculator:
@@ -1013,14 +1392,15 @@ class SessionCalculator:
                 else current_time + timedelta(hours=5)  # Default session duration
             )
 
-        # Calculate session times
-        time_to_reset = reset_time - current_time
-        minutes_to_reset = time_to_reset.total_seconds() / 60
+        # Calculate session times on epoch seconds
+        now_ts = current_time.timestamp()
+        reset_ts = reset_time.timestamp()
+        minutes_to_reset = (reset_ts - now_ts) / 60
 
         if start_time and session_data.get("end_time_str"):
-            total_session_minutes = (reset_time - start_time).total_seconds() / 60
-            elapsed_session_minutes = (current_time - start_time).total_seconds() / 60
-            elapsed_session_minutes = max(0, elapsed_session_minutes)
+            start_ts = start_time.timestamp()
+            total_session_minutes = (reset_ts - start_ts) / 60
+            elapsed_session_minutes = max(0, (now_ts - start_ts) / 60)
         else:
             total_session_minutes = 5 * 60  # Default session duration in minutes
             elapsed_session_minutes = max(0, total_session_minutes - minutes_to_reset)
@@ -1028,6 +1408,7 @@ class SessionCalculator:
         return {
             "start_time": start_time,
             "reset_time": reset_time,
+            "current_time": current_time,
             "minutes_to_reset": minutes_to_reset,
             "total_session_minutes": total_session_minutes,
             "elapsed_session_minutes": elapsed_session_minutes,
@@ -1038,6 +1419,7 @@ class SessionCalculator:
         session_data: Dict[str, Any],
         time_data: Dict[str, Any],
         cost_limit: Optional[float] = None,
+        current_time: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """Calculate cost-related predictions.
 
@@ -1045,13 +1427,15 @@ class SessionCalculator:
             session_data: Dictionary containing session cost information
             time_data: Time data from calculate_time_data
             cost_limit: Optional cost limit (defaults to 100.0)
+            current_time: Current UTC time (defaults to the time_data frame time)
 
         Returns:
             Dictionary with cost predictions
         """
         elapsed_minutes = time_data["elapsed_session_minutes"]
         session_cost = session_data.get("session_cost", 0.0)
-        current_time = datetime.now(timezone.utc)
+        if current_time is None:
+            current_time = time_data.get("current_time") or datetime.now(timezone.utc)
 
         # Calculate cost per minute
         cost_per_minute = (
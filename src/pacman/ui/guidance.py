@@ -7,21 +7,34 @@ Core principle: Resolve uncertainty, not create decisions.
 Feel like guidance, not a control panel.
 """
 
+import re
 from dataclasses import dataclass
-from enum import Enum, auto
-from typing import Any, Dict, List, Optional
+from enum import IntEnum, auto
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from pacman.terminal.input_handler import get_action_state
+from pacman.utils.compat import DATACLASS_SLOTS
 
 
-class TaskType(Enum):
-    """Classification of user task type."""
+class TaskType(IntEnum):
+    """Classification of user task type.
+
+    An IntEnum so members hash and compare as ints in the guidance memo key.
+    """
     CODING = auto()     # Complex tasks requiring Opus
     PLANNING = auto()   # Simple tasks suitable for Sonnet/Haiku
     UNKNOWN = auto()    # Cannot determine
 
 
-@dataclass
+# Members bound once; attribute access on an Enum class goes through a
+# descriptor and costs far more than a global name lookup
+_TT_CODING = TaskType.CODING
+_TT_PLANNING = TaskType.PLANNING
+_TT_UNKNOWN = TaskType.UNKNOWN
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class Guidance:
     """Single recommendation for the user.
 
@@ -59,10 +72,36 @@ PLANNING_KEYWORDS = [
     "compare", "difference between", "pros and cons", "when to use",
 ]
 
+# Single-word keywords match whole words; multi-word phrases match as whole
+# words too, through the \b-bounded _PHRASE_RE below
+CODING_TOKENS = frozenset(kw for kw in CODING_KEYWORDS if " " not in kw)
+CODING_PHRASES = [kw for kw in CODING_KEYWORDS if " " in kw]
+PLANNING_TOKENS = frozenset(kw for kw in PLANNING_KEYWORDS if " " not in kw)
+PLANNING_PHRASES = [kw for kw in PLANNING_KEYWORDS if " " in kw]
+
+# Score contribution per phrase: +1 toward coding, -1 toward planning
+_PHRASE_DELTA: Dict[str, int] = {kw: 1 for kw in CODING_PHRASES}
+_PHRASE_DELTA.update((kw, -1) for kw in PLANNING_PHRASES)
+
+# All phrases as one whole-word alternation, so a single regex pass finds them
+_PHRASE_RE = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, _PHRASE_DELTA)) + r")\b"
+)
+
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+
+
+# Only the latest messages reflect the current task; older ones dilute it
+TASK_WINDOW_MESSAGES = 5
+TASK_WINDOW_CHARS = 2048
+
 
 def detect_task_type(recent_messages: Optional[List[str]] = None) -> TaskType:
     """Analyze recent messages to classify task type.
 
+    Only the last TASK_WINDOW_MESSAGES messages are considered, and older
+    ones are dropped once TASK_WINDOW_CHARS characters have been collected.
+
     Args:
         recent_messages: List of recent message contents
 
@@ -70,30 +109,96 @@ def detect_task_type(recent_messages: Optional[List[str]] = None) -> TaskType:
         TaskType classification
     """
     if not recent_messages:
-        return TaskType.UNKNOWN
-
-    # Combine recent messages into one text block for analysis
-    combined = " ".join(recent_messages).lower()
-
-    # Count keyword matches
-    coding_score = sum(1 for kw in CODING_KEYWORDS if kw in combined)
-    planning_score = sum(1 for kw in PLANNING_KEYWORDS if kw in combined)
-
-    # Check for code indicators (file paths, code blocks)
-    if ".py" in combined or ".js" in combined or ".ts" in combined:
-        coding_score += 2
-    if "```" in combined:
-        coding_score += 2
-    if "/" in combined and ("src/" in combined or "lib/" in combined):
-        coding_score += 1
+        return _TT_UNKNOWN
+
+    window: List[str] = []
+    chars = 0
+    for message in reversed(recent_messages[-TASK_WINDOW_MESSAGES:]):
+        window.append(message)
+        chars += len(message)
+        if chars >= TASK_WINDOW_CHARS:
+            break
+
+    # Keyed by content, not list identity, so mutated lists are rescanned
+    return _classify_messages(tuple(reversed(window)))
+
+
+@lru_cache(maxsize=8)
+def _classify_messages(messages: Tuple[str, ...]) -> TaskType:
+    """Classify a non-empty tuple of messages (memoized across redraws)."""
+    words: Set[str] = set()
+    phrases: Set[str] = set()
+    code_file = code_block = source_path = False
+
+    # Scan message by message rather than joining them into one buffer;
+    # lower() is the fast path for ASCII, casefold() covers Unicode
+    for message in messages:
+        text = message.lower() if message.isascii() else message.casefold()
+        words.update(_WORD_RE.findall(text))
+        phrases.update(_PHRASE_RE.findall(text))
+        code_file = code_file or ".py" in text or ".js" in text or ".ts" in text
+        code_block = code_block or "```" in text
+        source_path = source_path or "src/" in text or "lib/" in text
+
+    # Only coding minus planning matters, so keep one net score:
+    # words by set intersection, phrases by whole-word regex
+    net = len(words & CODING_TOKENS) - len(words & PLANNING_TOKENS)
+    for kw in phrases:
+        net += _PHRASE_DELTA[kw]
+
+    # Code indicators (file paths, code blocks)
+    if code_file:
+        net += 2
+    if code_block:
+        net += 2
+    if source_path:
+        net += 1
 
     # Determine task type based on scores
-    if coding_score > planning_score + 1:
-        return TaskType.CODING
-    elif planning_score > coding_score + 1:
-        return TaskType.PLANNING
-
-    return TaskType.UNKNOWN
+    if net > 1:
+        return _TT_CODING
+    elif net < -1:
+        return _TT_PLANNING
+
+    return _TT_UNKNOWN
+
+
+# Guidance that never varies, shared by every call that reaches it
+_G_CRITICAL = Guidance(
+    primary="You're almost at your limit. Focus on finishing your current task.",
+    urgency="urgent",
+    action_prompt="Run /compact?",
+    action_command="compact",
+    interactive=True,
+)
+_G_OPUS_FOR_PLANNING = Guidance(
+    primary="You're using Opus for planning/questions.",
+    context="Sonnet handles research and planning well at lower cost.",
+    interactive=True,
+    suggested_model="sonnet",
+    action_prompt="Switch to Sonnet?",
+    action_command="model sonnet",
+)
+_G_CODING_WITHOUT_OPUS = Guidance(
+    primary="This looks like a coding task.",
+    context="Opus excels at complex implementation work.",
+    interactive=True,
+    suggested_model="opus",
+    action_prompt="Switch to Opus?",
+    action_command="model opus",
+)
+_G_HIGH_BURN = Guidance(
+    primary="High token velocity. Normal if you're in a complex task.",
+    urgency="calm",
+)
+_G_PACING = Guidance(
+    primary="Halfway through your window. You're pacing well.",
+    urgency="calm",
+)
+_G_HEALTHY = Guidance(
+    primary="You're in good shape.",
+    urgency="calm",
+)
 
 
 def _format_time(minutes: float) -> str:
@@ -148,25 +253,86 @@ def get_primary_guidance(
         Guidance object with single recommendation
     """
     opus_pct = model_distribution.get("opus", 0)
-    time_str = _format_time(minutes_to_reset)
+    usage_bucket = _usage_bucket(usage_percentage)
+    burn_bucket = 2 if burn_rate > 150 else 1 if burn_rate > 100 else 0
+
+    # Task type is only consulted once priorities 1 and 2 have passed
+    if usage_bucket >= 90 or (burn_bucket and usage_bucket >= 70):
+        task_type = _TT_UNKNOWN
+    else:
+        task_type = detect_task_type(recent_messages)
+
+    opus_bucket = 2 if opus_pct > 60 else 1 if opus_pct > 40 else 0
+
+    # The ladder only depends on which side of each threshold the inputs
+    # fall and on the rounded figures it prints, so equal keys share a result.
+    # Figures are only formatted when a branch that prints them can be hit,
+    # which also keeps them out of the key on every other path.
+    return _build_guidance(
+        usage_bucket,
+        f"{usage_percentage:.0f}" if burn_bucket and usage_bucket >= 70 else "",
+        burn_bucket,
+        opus_bucket,
+        f"{opus_pct:.0f}" if opus_bucket >= 2 and usage_bucket >= 50 else "",
+        _is_opus_model(current_model),
+        task_type,
+        _format_time(minutes_to_reset) if usage_bucket >= 75 else "",
+    )
 
-    # Detect task type for smart model suggestions
-    task_type = detect_task_type(recent_messages)
 
-    # Priority 1: Critical usage (>=90%)
+@lru_cache(maxsize=32)
+def _is_opus_model(model: str) -> bool:
+    """Whether a model name refers to Opus (memoized per name)."""
+    return "opus" in model.lower()
+
+
+def _usage_bucket(usage_percentage: float) -> int:
+    """Quantize usage to the thresholds the guidance ladder compares against."""
     if usage_percentage >= 90:
-        return Guidance(
-            primary="You're almost at your limit. Focus on finishing your current task.",
-            urgency="urgent",
-            action_prompt="Run /compact?",
-            action_command="compact",
-            interactive=True,
-        )
+        return 90
+    if usage_percentage >= 75:
+        return 75
+    if usage_percentage >= 70:
+        return 70
+    if usage_percentage >= 50:
+        return 50
+    return 0
+
+
+@lru_cache(maxsize=256)
+def _build_guidance(
+    usage_bucket: int,
+    usage_label: str,
+    burn_bucket: int,
+    opus_bucket: int,
+    opus_label: str,
+    on_opus: bool,
+    task_type: TaskType,
+    time_str: str,
+) -> Guidance:
+    """Walk the priority ladder for quantized inputs.
+
+    Args:
+        usage_bucket: Highest of 90/75/70/50 reached by usage, else 0
+        usage_label: Usage percentage rounded for display
+        burn_bucket: 2 if burn rate > 150, 1 if > 100, else 0
+        opus_bucket: 2 if Opus share > 60%, 1 if > 40%, else 0
+        opus_label: Opus share rounded for display
+        on_opus: Whether the current model is an Opus model
+        task_type: Detected task type
+        time_str: Formatted time until reset
+
+    Returns:
+        Guidance object with single recommendation
+    """
+    # Priority 1: Critical usage (>=90%)
+    if usage_bucket >= 90:
+        return _G_CRITICAL
 
     # Priority 2: High burn + high usage
-    if burn_rate > 100 and usage_percentage >= 70:
+    if burn_bucket >= 1 and usage_bucket >= 70:
         return Guidance(
-            primary=f"Using tokens quickly at {usage_percentage:.0f}%. Consider wrapping up.",
+            primary=f"Using tokens quickly at {usage_label}%. Consider wrapping up.",
             urgency="urgent",
             action_prompt="Run /compact?",
             action_command="compact",
@@ -174,34 +340,18 @@ def get_primary_guidance(
         )
 
     # Priority 3: Smart model suggestions based on task type
-    current_model_lower = current_model.lower()
-
     # Using Opus on simple tasks
-    if task_type == TaskType.PLANNING and "opus" in current_model_lower and opus_pct > 40:
-        return Guidance(
-            primary="You're using Opus for planning/questions.",
-            context="Sonnet handles research and planning well at lower cost.",
-            interactive=True,
-            suggested_model="sonnet",
-            action_prompt="Switch to Sonnet?",
-            action_command="model sonnet",
-        )
+    if task_type is _TT_PLANNING and on_opus and opus_bucket >= 1:
+        return _G_OPUS_FOR_PLANNING
 
     # Using Sonnet/Haiku on complex coding tasks
-    if task_type == TaskType.CODING and "opus" not in current_model_lower and usage_percentage < 70:
-        return Guidance(
-            primary="This looks like a coding task.",
-            context="Opus excels at complex implementation work.",
-            interactive=True,
-            suggested_model="opus",
-            action_prompt="Switch to Opus?",
-            action_command="model opus",
-        )
+    if task_type is _TT_CODING and not on_opus and usage_bucket < 70:
+        return _G_CODING_WITHOUT_OPUS
 
     # Priority 4: Heavy Opus usage with moderate+ usage
-    if opus_pct > 60 and usage_percentage >= 50:
+    if opus_bucket >= 2 and usage_bucket >= 50:
         return Guidance(
-            primary=f"Opus is handling {opus_pct:.0f}% of your work. Sonnet is often sufficient and more economical.",
+            primary=f"Opus is handling {opus_label}% of your work. Sonnet is often sufficient and more economical.",
             urgency="normal",
             action_prompt="Switch to Sonnet?",
             action_command="model sonnet",
@@ -209,7 +359,7 @@ def get_primary_guidance(
         )
 
     # Priority 5: High usage (>=75%)
-    if usage_percentage >= 75:
+    if usage_bucket >= 75:
         return Guidance(
             primary=f"Running low on tokens. Resets in {time_str}.",
             urgency="normal",
@@ -219,24 +369,15 @@ def get_primary_guidance(
         )
 
     # Priority 6: High burn rate alone
-    if burn_rate > 150:
-        return Guidance(
-            primary="High token velocity. Normal if you're in a complex task.",
-            urgency="calm",
-        )
+    if burn_bucket >= 2:
+        return _G_HIGH_BURN
 
     # Priority 7: Moderate usage (50-74%)
-    if usage_percentage >= 50:
-        return Guidance(
-            primary="Halfway through your window. You're pacing well.",
-            urgency="calm",
-        )
+    if usage_bucket >= 50:
+        return _G_PACING
 
     # Priority 8: Healthy (<50%)
-    return Guidance(
-        primary="You're in good shape.",
-        urgency="calm",
-    )
+    return _G_HEALTHY
 
 
 def handle_model_switch(target_model: str) -> bool:
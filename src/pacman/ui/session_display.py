@@ -6,10 +6,13 @@ Handles formatting of active session screens and session data display.
 import sys
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Optional, List
 
 import pytz
 
+from pacman.core.plans import DEFAULT_COST_LIMIT
+from pacman.terminal.themes import get_cost_style
 from pacman.ui.components import CostIndicator, VelocityIndicator
 from pacman.ui.guidance import get_primary_guidance
 from pacman.terminal.input_handler import get_action_state
@@ -19,13 +22,107 @@ from pacman.ui.progress_bars import (
     TimeProgressBar,
     TokenProgressBar,
 )
+from pacman.utils.compat import DATACLASS_SLOTS
 from pacman.utils.time_utils import (
     format_display_time,
     get_time_format_preference,
-    percentage,
 )
 
 
+# Divider between sections of the active session screen
+_SEPARATOR_LINE = f"[separator]{'─' * 60}[/]"
+
+# Shared renderer for the 50-char bars of the active session screen
+_WIDE_BAR = TokenProgressBar(width=50)
+
+
+@lru_cache(maxsize=512)
+def _render_wide_bar(filled: int, over: bool, color: str, bar_style: str) -> str:
+    """Render a wide progress bar for its visible inputs (memoized)."""
+    if over:
+        filled_bar = _WIDE_BAR._render_bar(50, filled_style=bar_style)
+    else:
+        filled_bar = _WIDE_BAR._render_bar(
+            filled, filled_style=bar_style, empty_style="table.border"
+        )
+    return f"{color} [{filled_bar}]"
+
+
+# Mini bars for the top contributors section, indexed by filled cells
+_CONTRIB_BAR_WIDTH = 12
+_CONTRIB_BARS = tuple(
+    "█" * i + "░" * (_CONTRIB_BAR_WIDTH - i) for i in range(_CONTRIB_BAR_WIDTH + 1)
+)
+
+
+@lru_cache(maxsize=1024, typed=True)
+def _thousands(value: float) -> str:
+    """Format a number with thousands separators (memoized across frames)."""
+    return f"{value:,}"
+
+
+def _format_contrib_tokens(tokens: int) -> str:
+    """Format a token count compactly (e.g., 45.2K)."""
+    if tokens >= 1_000_000:
+        return f"{tokens / 1_000_000:.1f}M"
+    if tokens >= 1_000:
+        return f"{tokens / 1_000:.1f}K"
+    return str(tokens)
+
+
+def _context_health_state(
+    usage_bucket: int, high_burn: bool, heavy_opus: bool, auto_compact: bool
+) -> tuple[str, str, str]:
+    """Resolve (emoji, status, style) for one context-health bucket."""
+    # Critical: usage at/above compact threshold (70%) with auto-compact, or ≥80%
+    if usage_bucket == 2 or (auto_compact and usage_bucket == 1):
+        return "🔴", "Critical", "error"
+    # Moderate: high burn rate or heavy Opus usage
+    if high_burn or heavy_opus:
+        return "🟡", "Moderate", "warning"
+    return "🟢", "Healthy", "success"
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class _ContribSoA:
+    """Top contributors as parallel tuples, extracted once per frame."""
+
+    names: tuple[str, ...]
+    names_lower: tuple[str, ...]
+    tokens: tuple[int, ...]
+    pcts: tuple[float, ...]
+    input_tokens: tuple[int, ...]
+    output_tokens: tuple[int, ...]
+    has_opus_over_50: bool
+
+    @classmethod
+    def from_contributors(cls, top_contributors: list[dict[str, Any]]) -> "_ContribSoA":
+        """Build from the contributor dicts (type, name, tokens, percentage)."""
+        names_lower = tuple(c.get("name", "").lower() for c in top_contributors)
+        pcts = tuple(c.get("percentage", 0) for c in top_contributors)
+        return cls(
+            names=tuple(c.get("name", "Unknown") for c in top_contributors),
+            names_lower=names_lower,
+            tokens=tuple(c.get("tokens", 0) for c in top_contributors),
+            pcts=pcts,
+            input_tokens=tuple(c.get("input_tokens", 0) for c in top_contributors),
+            output_tokens=tuple(c.get("output_tokens", 0) for c in top_contributors),
+            has_opus_over_50=any(
+                pct > 50 and "opus" in name for name, pct in zip(names_lower, pcts)
+            ),
+        )
+
+
+# Context health for every (usage bucket, high burn, heavy Opus, auto-compact)
+_HEALTH_TABLE: dict[tuple[int, bool, bool, bool], tuple[str, str, str]] = {
+    (usage, burn, opus, compact): _context_health_state(usage, burn, opus, compact)
+    for usage in (0, 1, 2)
+    for burn in (False, True)
+    for opus in (False, True)
+    for compact in (False, True)
+}
+
+
 @dataclass
 class SessionDisplayData:
     """Data container for session display information.
@@ -63,43 +160,50 @@ class SessionDisplayComponent:
         self.token_progress = TokenProgressBar()
         self.time_progress = TimeProgressBar()
         self.model_usage = ModelUsageBar()
+        self._header_manager = HeaderManager()
+        self._header_cache: dict[tuple[str, str], list[str]] = {}
+
+    def _header_lines(self, plan: str, timezone: str) -> list[str]:
+        """Return the screen header for a plan and timezone (cached).
+
+        The returned list is shared; callers must copy it, not mutate it.
+        """
+        key = (plan, timezone)
+        lines = self._header_cache.get(key)
+        if lines is None:
+            lines = self._header_manager.create_header(plan, timezone)
+            self._header_cache[key] = lines
+        return lines
 
     def _compute_context_health(
         self,
         usage_percentage: float,
         burn_rate: float,
-        top_contributors: Optional[list[dict[str, Any]]],
+        contribs: Optional[_ContribSoA],
         auto_compact: bool,
-    ) -> tuple[str, str]:
+    ) -> tuple[str, str, str]:
         """Compute context health status from existing metrics.
 
         Args:
             usage_percentage: Current token usage percentage
             burn_rate: Current burn rate in tokens/min
-            top_contributors: Top token contributors data
+            contribs: Top token contributors, if any
             auto_compact: Whether auto-compact is enabled
 
         Returns:
-            Tuple of (emoji, status_text)
+            Tuple of (emoji, status_text, style)
         """
-        # Critical: usage at/above compact threshold (70%) with auto-compact, or ≥80%
         if usage_percentage >= 80:
-            return "🔴", "Critical"
-        if auto_compact and usage_percentage >= 70:
-            return "🔴", "Critical"
-
-        # Moderate: high burn rate or heavy Opus usage
-        if burn_rate > 100:
-            return "🟡", "Moderate"
-
-        if top_contributors:
-            for contrib in top_contributors:
-                name_lower = contrib.get("name", "").lower()
-                pct = contrib.get("percentage", 0)
-                if "opus" in name_lower and pct > 50:
-                    return "🟡", "Moderate"
+            usage_bucket = 2
+        elif usage_percentage >= 70:
+            usage_bucket = 1
+        else:
+            usage_bucket = 0
 
-        return "🟢", "Healthy"
+        heavy_opus = contribs is not None and contribs.has_opus_over_50
+        return _HEALTH_TABLE[
+            (usage_bucket, burn_rate > 100, heavy_opus, bool(auto_compact))
+        ]
 
     def _render_wide_progress_bar(self, percentage: float) -> str:
         """Render a wide progress bar (50 chars) using centralized progress bar logic.
@@ -110,8 +214,6 @@ class SessionDisplayComponent:
         Returns:
             Formatted progress bar string
         """
-        from pacman.terminal.themes import get_cost_style
-
         if percentage < 50:
             color = "🟢"
         elif percentage < 80:
@@ -119,20 +221,11 @@ class SessionDisplayComponent:
         else:
             color = "🔴"
 
-        progress_bar = TokenProgressBar(width=50)
-        bar_style = get_cost_style(percentage)
-
-        capped_percentage = min(percentage, 100.0)
-        filled = progress_bar._calculate_filled_segments(capped_percentage, 100.0)
-
-        if percentage >= 100:
-            filled_bar = progress_bar._render_bar(50, filled_style=bar_style)
-        else:
-            filled_bar = progress_bar._render_bar(
-                filled, filled_style=bar_style, empty_style="table.border"
-            )
-
-        return f"{color} [{filled_bar}]"
+        # The output only changes with these inputs, so render via the cache
+        filled = _WIDE_BAR._calculate_filled_segments(min(percentage, 100.0), 100.0)
+        return _render_wide_bar(
+            filled, percentage >= 100, color, get_cost_style(percentage)
+        )
 
     def format_active_session_screen_v2(self, data: SessionDisplayData) -> list[str]:
         """Format complete active session screen using data class.
@@ -168,44 +261,38 @@ class SessionDisplayComponent:
             original_limit=data.original_limit,
         )
 
-    def _render_top_contributors_section(
-        self, top_contributors: list[dict[str, Any]]
-    ) -> list[str]:
+    def _render_top_contributors_section(self, contribs: _ContribSoA) -> list[str]:
         """Render the top token contributors section.
 
         Args:
-            top_contributors: List of contributor dicts with type, name, tokens, percentage
+            contribs: Top token contributors as parallel tuples
 
         Returns:
             List of formatted lines for the contributors section
         """
         lines: list[str] = []
 
-        if not top_contributors:
+        if not contribs.names:
             return lines
 
         lines.append("")
         lines.append("[bold]📈 Top Token Contributors[/bold] [dim](estimated)[/dim]")
 
-        for i, contrib in enumerate(top_contributors[:5], 1):
-            name = contrib.get("name", "Unknown")
-            tokens = contrib.get("tokens", 0)
-            pct = contrib.get("percentage", 0)
-            input_tokens = contrib.get("input_tokens", 0)
-            output_tokens = contrib.get("output_tokens", 0)
+        for i in range(min(5, len(contribs.names))):
+            name = contribs.names[i]
+            tokens = contribs.tokens[i]
+            pct = contribs.pcts[i]
+            input_tokens = contribs.input_tokens[i]
+            output_tokens = contribs.output_tokens[i]
 
             # Create a mini bar visualization
-            bar_width = 12
-            filled = int((pct / 100) * bar_width)
-            bar = "█" * filled + "░" * (bar_width - filled)
-
-            # Format tokens compactly (e.g., 45.2K)
-            if tokens >= 1_000_000:
-                tokens_str = f"{tokens / 1_000_000:.1f}M"
-            elif tokens >= 1_000:
-                tokens_str = f"{tokens / 1_000:.1f}K"
+            filled = int((pct / 100) * _CONTRIB_BAR_WIDTH)
+            if 0 <= filled <= _CONTRIB_BAR_WIDTH:
+                bar = _CONTRIB_BARS[filled]
             else:
-                tokens_str = str(tokens)
+                bar = "█" * filled + "░" * (_CONTRIB_BAR_WIDTH - filled)
+
+            tokens_str = _format_contrib_tokens(tokens)
 
             # Show input/output breakdown
             if input_tokens >= 1_000:
@@ -218,7 +305,7 @@ class SessionDisplayComponent:
                 out_str = str(output_tokens)
 
             lines.append(
-                f"   {i}. [value]{name:<18}[/] [dim]{bar}[/] [info]{tokens_str:>6}[/] ({pct:4.1f}%) [dim]in:{in_str} out:{out_str}[/]"
+                f"   {i + 1}. [value]{name:<18}[/] [dim]{bar}[/] [info]{tokens_str:>6}[/] ({pct:4.1f}%) [dim]in:{in_str} out:{out_str}[/]"
             )
 
         lines.append("[dim]   Token Manager: optimization engine (coming soon)[/dim]")
@@ -229,7 +316,7 @@ class SessionDisplayComponent:
         self,
         usage_percentage: float,
         burn_rate: float,
-        top_contributors: Optional[list[dict[str, Any]]],
+        contribs: Optional[_ContribSoA],
         minutes_to_reset: float = 0.0,
         current_model: str = "opus",
     ) -> list[str]:
@@ -238,7 +325,7 @@ class SessionDisplayComponent:
         Args:
             usage_percentage: Current token usage percentage
             burn_rate: Current burn rate
-            top_contributors: Top token contributors data
+            contribs: Top token contributors, if any
             minutes_to_reset: Minutes until token reset
             current_model: Currently active model name
 
@@ -247,10 +334,8 @@ class SessionDisplayComponent:
         """
         # Extract model distribution from top contributors
         model_distribution: dict[str, float] = {}
-        if top_contributors:
-            for contrib in top_contributors:
-                name_lower = contrib.get("name", "").lower()
-                pct = contrib.get("percentage", 0)
+        if contribs is not None:
+            for name_lower, pct in zip(contribs.names_lower, contribs.pcts):
                 if "opus" in name_lower:
                     model_distribution["opus"] = model_distribution.get("opus", 0) + pct
                 elif "sonnet" in name_lower:
@@ -336,24 +421,21 @@ class SessionDisplayComponent:
 
         screen_buffer = []
 
-        header_manager = HeaderManager()
-        screen_buffer.extend(header_manager.create_header(plan, timezone))
+        screen_buffer.extend(self._header_lines(plan, timezone))
+
+        # Extract contributor fields once for the health, contributors and
+        # guidance sections
+        contribs = None
+        if top_contributors:
+            contribs = _ContribSoA.from_contributors(top_contributors)
 
         # Add context health line
-        health_emoji, health_status = self._compute_context_health(
-            usage_percentage, burn_rate, top_contributors, auto_compact
+        health_emoji, health_status, health_style = self._compute_context_health(
+            usage_percentage, burn_rate, contribs, auto_compact
         )
-        if health_status == "Critical":
-            health_style = "error"
-        elif health_status == "Moderate":
-            health_style = "warning"
-        else:
-            health_style = "success"
         screen_buffer.append(f"{health_emoji} [value]Context health:[/] [{health_style}]{health_status}[/]")
 
         if plan in ["custom", "pro", "max5", "max20"]:
-            from pacman.core.plans import DEFAULT_COST_LIMIT
-
             cost_limit_p90 = kwargs.get("cost_limit_p90", DEFAULT_COST_LIMIT)
             messages_limit_p90 = kwargs.get("messages_limit_p90", 1500)
 
@@ -363,12 +445,13 @@ class SessionDisplayComponent:
                 screen_buffer.append(
                     "[dim]Based on your historical usage patterns when hitting limits (P90)[/dim]"
                 )
-                screen_buffer.append(f"[separator]{'─' * 60}[/]")
+                screen_buffer.append(_SEPARATOR_LINE)
             else:
                 screen_buffer.append("")
 
+            # Guarded inline percentages; min() caps without a branch
             cost_percentage = (
-                min(100, percentage(session_cost, cost_limit_p90))
+                min(100, round(session_cost / cost_limit_p90 * 100, 1))
                 if cost_limit_p90 > 0
                 else 0
             )
@@ -380,23 +463,23 @@ class SessionDisplayComponent:
 
             token_bar = self._render_wide_progress_bar(usage_percentage)
             screen_buffer.append(
-                f"📊 [value]Token Usage:[/]          {token_bar} {usage_percentage:4.1f}%    [value]{tokens_used:,}[/] / [dim]{token_limit:,}[/]"
+                f"📊 [value]Token Usage:[/]          {token_bar} {usage_percentage:4.1f}%    [value]{_thousands(tokens_used)}[/] / [dim]{_thousands(token_limit)}[/]"
             )
             screen_buffer.append("")
 
             messages_percentage = (
-                min(100, percentage(sent_messages, messages_limit_p90))
+                min(100, round(sent_messages / messages_limit_p90 * 100, 1))
                 if messages_limit_p90 > 0
                 else 0
             )
             messages_bar = self._render_wide_progress_bar(messages_percentage)
             screen_buffer.append(
-                f"📨 [value]Messages Usage:[/]       {messages_bar} {messages_percentage:4.1f}%    [value]{sent_messages}[/] / [dim]{messages_limit_p90:,}[/]"
+                f"📨 [value]Messages Usage:[/]       {messages_bar} {messages_percentage:4.1f}%    [value]{sent_messages}[/] / [dim]{_thousands(messages_limit_p90)}[/]"
             )
-            screen_buffer.append(f"[separator]{'─' * 60}[/]")
+            screen_buffer.append(_SEPARATOR_LINE)
 
             time_percentage = (
-                percentage(elapsed_session_minutes, total_session_minutes)
+                round(elapsed_session_minutes / total_session_minutes * 100, 1)
                 if total_session_minutes > 0
                 else 0
             )
@@ -415,7 +498,7 @@ class SessionDisplayComponent:
             else:
                 model_bar = self.model_usage.render({})
                 screen_buffer.append(f"🤖 [value]Model Distribution:[/]   {model_bar}")
-            screen_buffer.append(f"[separator]{'─' * 60}[/]")
+            screen_buffer.append(_SEPARATOR_LINE)
 
             velocity_emoji = VelocityIndicator.get_velocity_emoji(burn_rate)
             screen_buffer.append(
@@ -448,7 +531,7 @@ class SessionDisplayComponent:
             screen_buffer.append("")
 
             screen_buffer.append(
-                f"🎯 [value]Tokens:[/]         [value]{tokens_used:,}[/] / [dim]~{token_limit:,}[/] ([info]{tokens_left:,} left[/])"
+                f"🎯 [value]Tokens:[/]         [value]{_thousands(tokens_used)}[/] / [dim]~{_thousands(token_limit)}[/] ([info]{_thousands(tokens_left)} left[/])"
             )
 
             velocity_emoji = VelocityIndicator.get_velocity_emoji(burn_rate)
@@ -473,8 +556,8 @@ class SessionDisplayComponent:
             screen_buffer.append("")
 
         # Add top contributors section
-        if top_contributors:
-            screen_buffer.extend(self._render_top_contributors_section(top_contributors))
+        if contribs is not None:
+            screen_buffer.extend(self._render_top_contributors_section(contribs))
 
         # Add guidance section
         minutes_to_reset = max(0, total_session_minutes - elapsed_session_minutes)
@@ -492,7 +575,7 @@ class SessionDisplayComponent:
             self._render_guidance_section(
                 usage_percentage,
                 burn_rate,
-                top_contributors,
+                contribs,
                 minutes_to_reset=minutes_to_reset,
                 current_model=current_model,
             )
@@ -593,8 +676,7 @@ class SessionDisplayComponent:
 
         screen_buffer = []
 
-        header_manager = HeaderManager()
-        screen_buffer.extend(header_manager.create_header(plan, timezone))
+        screen_buffer.extend(self._header_lines(plan, timezone))
 
         empty_token_bar = self.token_progress.render(0.0)
         screen_buffer.append(f"📊 [value]Token Usage:[/]    {empty_token_bar}")
@@ -1,15 +1,160 @@
 """Simplified human-first display for Pacman Token Manager."""
 
-from datetime import datetime, timedelta
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+import heapq
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 from rich.console import Console
-from rich.text import Text
+from rich.style import Style
+from rich.text import Span, Text
 
-from pacman.ui.guidance import get_primary_guidance, Guidance
+from pacman.ui.guidance import get_primary_guidance
 from pacman.terminal.input_handler import get_action_state
 
 
+@lru_cache(maxsize=256)
+def _bar_string(filled: int, width: int) -> str:
+    """Build a progress bar with the given number of filled cells."""
+    return "█" * filled + "░" * (width - filled)
+
+
+@lru_cache(maxsize=256)
+def _state_for(
+    percent: int, green_threshold: int, orange_threshold: int
+) -> Tuple[str, str]:
+    """Map a whole usage percentage to a (state, ANSI colour) pair."""
+    if percent < green_threshold:
+        return ("green", "32")  # Green ANSI
+    elif percent < orange_threshold:
+        return ("orange", "33")  # Yellow ANSI
+    else:
+        return ("red", "31")  # Red ANSI
+
+
+@lru_cache(maxsize=1024)
+def _format_tokens(tokens: int) -> str:
+    """Format token count to human readable (e.g., 29k)."""
+    if tokens >= 1_000_000:
+        return f"{tokens / 1_000_000:.1f}m"
+    elif tokens >= 1_000:
+        return f"{tokens // 1_000}k"
+    else:
+        return str(tokens)
+
+
+@lru_cache(maxsize=1024)
+def _format_minutes(minutes: int) -> str:
+    """Format whole minutes (at least one) to Xh Xm format."""
+    hours, mins = divmod(minutes, 60)
+    if hours > 0:
+        return f"{hours}h {mins}m"
+    return f"{mins}m"
+
+
+# Common path components dropped from encoded project paths
+_PATH_NOISE = frozenset(("Users", "Desktop", "Documents"))
+
+
+@lru_cache(maxsize=256)
+def _clean_project_name(project_path: str) -> str:
+    """Extract clean folder name from project path."""
+    # Handle encoded paths like "-Users-hsiaotsui-mou-Desktop-Learn-Code---Token-Manager-CLI"
+    if project_path.startswith("-"):
+        # Walk the dash-separated parts from the end, skipping empty parts and
+        # common path components, and stop once the last three are found
+        tail: List[str] = []
+        for part in reversed(project_path.split("-")):
+            if part and part not in _PATH_NOISE:
+                tail.append(part)
+                if len(tail) == 3:
+                    break
+        if tail:
+            # Return last 2-3 parts joined
+            return "-".join(reversed(tail))[:20]
+    return project_path[:20]
+
+
+@lru_cache(maxsize=64)
+def _wrap_words(text: str, max_width: int) -> Tuple[str, ...]:
+    """Greedily word-wrap text to max_width (memoized; guidance rarely changes)."""
+    words = text.split()
+    lines = []
+    current_line: List[str] = []
+    current_length = 0
+
+    for word in words:
+        if current_length + len(word) + (1 if current_line else 0) <= max_width:
+            current_line.append(word)
+            current_length += len(word) + (1 if len(current_line) > 1 else 0)
+        else:
+            if current_line:
+                lines.append(" ".join(current_line))
+            current_line = [word]
+            current_length = len(word)
+
+    if current_line:
+        lines.append(" ".join(current_line))
+
+    return tuple(lines) if lines else ("",)
+
+
+# Prebuilt runs of spaces indexed by length, so padding never allocates
+_PADS = tuple(" " * i for i in range(257))
+
+
+def _pad(n: int) -> str:
+    """Return n spaces, at most 256 (none when n is not positive)."""
+    return _PADS[min(n, 256)] if n > 0 else ""
+
+
+# Module-level memo caches, all bounded at 1024 entries or fewer
+_CACHED = (
+    _bar_string,
+    _state_for,
+    _format_tokens,
+    _format_minutes,
+    _clean_project_name,
+    _wrap_words,
+)
+
+
+def clear_all_caches() -> None:
+    """Drop every module-level memo cache (e.g. after a resize)."""
+    for cached in _CACHED:
+        cached.cache_clear()
+
+
+# Label / bar / token layout shared by the breakdown rows
+_BAR_ROW = "{:<18} {} {}".format
+
+
+# Rendered card and the action command it prompted for, if any
+_CachedCard = Tuple[Text, Optional[str]]
+
+# Styles used by the status card
+_STYLE_YELLOW = Style(color="yellow")
+_STYLE_GREEN = Style(color="green")
+_STYLE_CYAN = Style(color="cyan")
+_STYLE_DIM = Style(color="bright_black")
+
+# Styles for the ANSI colour codes returned by _get_state and _get_alert
+_CODE_STYLES: Dict[str, Style] = {
+    "31": Style(color="red"),
+    "31;1": Style(color="red", bold=True),
+    "32": _STYLE_GREEN,
+    "33": _STYLE_YELLOW,
+    "38;5;208": Style(color="color(208)"),
+}
+
+# Separator for joining card rows; Text.join never mutates it
+_NEWLINE = Text("\n")
+
+# A row fragment: plain text or (text, style)
+_Part = Union[str, Tuple[str, Style]]
+
+
 class SimpleDisplayComponent:
     """Clean, human-first status card display."""
 
@@ -27,50 +172,61 @@ class SimpleDisplayComponent:
     LEFT_T = "├"
     RIGHT_T = "┤"
 
+    # Number of distinct rendered cards kept for reuse
+    RENDER_CACHE_SIZE = 64
+
     def __init__(self, console: Optional[Console] = None):
         self.console = console or Console()
         self.width = 64  # Fixed width for consistency
+        # Rendered card and the action it offered, keyed on render inputs
+        self._render_cache: "OrderedDict[Tuple[Any, ...], _CachedCard]" = OrderedDict()
+        # Last inputs and rows per breakdown section, rebuilt only on change
+        self._section_cache: Dict[str, Tuple[Tuple[Any, ...], List[Text]]] = {}
+        # Rows that depend only on the width, built once and reused every render
+        title = "Pacman Token Manager"
+        self._empty_row = self._row()
+        self._top_edge = self._edge(
+            f"{self.TOP_LEFT}{self.HORIZONTAL * (self.width - 2)}{self.TOP_RIGHT}"
+        )
+        title_pad = _pad(self.width - len(title) - 4)
+        self._title_row = self._edge(f"{self.VERTICAL}  {title}{title_pad}{self.VERTICAL}")
+        self._divider = self._edge(self._horizontal_line())
+        self._section_dividers: Dict[str, Text] = {
+            label: self._edge(self._horizontal_line(label))
+            for label in ("Usage over time", "Breakdown", "Guidance")
+        }
+        self._bottom_edge = self._edge(
+            f"{self.BOTTOM_LEFT}{self.HORIZONTAL * (self.width - 2)}{self.BOTTOM_RIGHT}"
+        )
 
     def _get_state(self, usage_percentage: float) -> Tuple[str, str]:
         """Determine state based on usage percentage."""
-        if usage_percentage < self.GREEN_THRESHOLD:
-            return ("green", "32")  # Green ANSI
-        elif usage_percentage < self.ORANGE_THRESHOLD:
-            return ("orange", "33")  # Yellow ANSI
-        else:
-            return ("red", "31")  # Red ANSI
+        # Thresholds are whole percentages, so flooring keeps the comparison
+        return _state_for(
+            int(usage_percentage), self.GREEN_THRESHOLD, self.ORANGE_THRESHOLD
+        )
 
     def _format_tokens(self, tokens: int) -> str:
         """Format token count to human readable (e.g., 29k)."""
-        if tokens >= 1_000_000:
-            return f"{tokens / 1_000_000:.1f}m"
-        elif tokens >= 1_000:
-            return f"{tokens // 1_000}k"
-        else:
-            return str(tokens)
+        return _format_tokens(tokens)
 
     def _format_time(self, minutes: float) -> str:
         """Format minutes to Xh Xm format."""
         if minutes < 1:
             return "< 1m"
-        hours = int(minutes // 60)
-        mins = int(minutes % 60)
-        if hours > 0:
-            return f"{hours}h {mins}m"
-        return f"{mins}m"
+        return _format_minutes(int(minutes))
 
     def _get_window_start_time(self, minutes_to_reset: float) -> str:
         """Calculate and format when the 5-hour window started."""
         # 5-hour window = 300 minutes
         minutes_elapsed = 300 - minutes_to_reset
-        start_time = datetime.now() - timedelta(minutes=minutes_elapsed)
-        return start_time.strftime("%I:%M %p").lstrip("0")
+        start_ts = time.time() - minutes_elapsed * 60
+        return time.strftime("%I:%M %p", time.localtime(start_ts)).lstrip("0")
 
     def _render_bar(self, percentage: float, width: int = 12) -> str:
         """Render a progress bar."""
         filled = int((min(percentage, 100) / 100) * width)
-        empty = width - filled
-        return "█" * filled + "░" * empty
+        return _bar_string(filled, width)
 
     def _horizontal_line(self, label: str = "") -> str:
         """Create a horizontal divider line with optional label."""
@@ -83,28 +239,26 @@ class SimpleDisplayComponent:
 
     def _clean_project_name(self, project_path: str) -> str:
         """Extract clean folder name from project path."""
-        # Handle encoded paths like "-Users-hsiaotsui-mou-Desktop-Learn-Code---Token-Manager-CLI"
-        if project_path.startswith("-"):
-            # Split by dash and get last meaningful part
-            parts = project_path.split("-")
-            # Filter out empty parts and common path components
-            meaningful = [p for p in parts if p and p not in ["Users", "Desktop", "Documents"]]
-            if meaningful:
-                # Return last 2-3 parts joined
-                return "-".join(meaningful[-3:])[:20]
-        return project_path[:20]
+        return _clean_project_name(project_path)
 
     def _get_alert(
         self,
         usage_pct: float,
         minutes_to_reset: float,
+        time_str: str,
     ) -> Optional[Tuple[str, str]]:
         """Get alert banner if threshold is crossed.
 
+        Args:
+            usage_pct: Current usage percentage
+            minutes_to_reset: Minutes until reset
+            time_str: Formatted time until reset
+
         Returns:
             Tuple of (ANSI color code, alert message) or None
         """
-        time_str = self._format_time(minutes_to_reset)
+        if usage_pct < 50:
+            return None
         window_start = self._get_window_start_time(minutes_to_reset)
 
         # Critical: 90%+ usage
@@ -116,14 +270,52 @@ class SimpleDisplayComponent:
             return ("38;5;208", f"Running low · Resets in {time_str} (started {window_start})")
 
         # Notice: 50%+ usage
-        if usage_pct >= 50:
-            return ("33", f"Halfway there · Resets in {time_str} (started {window_start})")
-
-        return None
+        return ("33", f"Halfway there · Resets in {time_str} (started {window_start})")
 
-    def _empty_line(self) -> str:
+    def _empty_line(self) -> Text:
         """Return an empty line with borders."""
-        return f"\033[33m{self.VERTICAL}\033[0m{' ' * (self.width - 2)}\033[33m{self.VERTICAL}\033[0m"
+        return self._empty_row
+
+    def _edge(self, line: str) -> Text:
+        """Colour a full-width border line."""
+        return Text(line, style=_STYLE_YELLOW)
+
+    def _row(self, *parts: _Part) -> Text:
+        """Wrap content fragments in side borders.
+
+        Args:
+            parts: Plain strings or (text, style) pairs making up the row
+
+        Returns:
+            Bordered row padded to the card width
+        """
+        # One join for the row text; spans are recorded alongside it
+        texts = [self.VERTICAL]
+        spans = [Span(0, 1, _STYLE_YELLOW)]
+        offset = 1
+        if parts:
+            texts.append("  ")
+            offset += 2
+        for part in parts:
+            if isinstance(part, str):
+                texts.append(part)
+                offset += len(part)
+            else:
+                text, style = part
+                texts.append(text)
+                if text:
+                    spans.append(Span(offset, offset + len(text), style))
+                offset += len(text)
+        padding = _pad(self.width - offset - 1)
+        offset += len(padding)
+        texts.append(padding)
+        texts.append(self.VERTICAL)
+        spans.append(Span(offset, offset + 1, _STYLE_YELLOW))
+        return Text("".join(texts), spans=spans)
+
+    def _dim_row(self, text: str) -> Text:
+        """Wrap plain text in grey inside side borders."""
+        return self._row((text, _STYLE_DIM))
 
     def _wrap_text(self, text: str, max_width: int) -> List[str]:
         """Word-wrap text to fit within max_width.
@@ -135,25 +327,59 @@ class SimpleDisplayComponent:
         Returns:
             List of wrapped lines
         """
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
+        return list(_wrap_words(text, max_width))
 
-        for word in words:
-            if current_length + len(word) + (1 if current_line else 0) <= max_width:
-                current_line.append(word)
-                current_length += len(word) + (1 if len(current_line) > 1 else 0)
-            else:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
+    def _cached_section(
+        self,
+        name: str,
+        key: Tuple[Any, ...],
+        build: Callable[[], List[Text]],
+    ) -> List[Text]:
+        """Return a section's rows, rebuilding them only when its inputs change.
 
-        if current_line:
-            lines.append(" ".join(current_line))
+        Args:
+            name: Section name
+            key: Hashable inputs the section's rows depend on
+            build: Builds the rows for the current inputs
 
-        return lines if lines else [""]
+        Returns:
+            Rows for the section
+        """
+        cached = self._section_cache.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        rows = build()
+        self._section_cache[name] = (key, rows)
+        return rows
+
+    def _model_rows(
+        self, model_items: Tuple[Tuple[str, float], ...], tokens_used: int
+    ) -> List[Text]:
+        """Build the By Model rows for the two largest models."""
+        top_models = heapq.nlargest(2, model_items, key=itemgetter(1))
+        max_pct = top_models[0][1] if top_models else 1
+
+        rows = []
+        for model_name, pct in top_models:
+            display_name = model_name.capitalize()
+            bar = self._render_bar((pct / max_pct) * 100, width=12)
+            model_tokens = int((pct / 100) * tokens_used)
+            tkn_str = self._format_tokens(model_tokens)
+            rows.append(self._row(_BAR_ROW(display_name, bar, tkn_str)))
+        return rows
+
+    def _project_rows(self, project_items: Tuple[Tuple[str, int], ...]) -> List[Text]:
+        """Build the By Project rows for the three largest projects."""
+        top_projects = heapq.nlargest(3, project_items, key=itemgetter(1))
+        max_proj_tokens = top_projects[0][1]
+
+        rows = []
+        for proj_name, proj_tokens in top_projects:
+            clean_name = self._clean_project_name(proj_name)
+            bar = self._render_bar((proj_tokens / max_proj_tokens) * 100 if max_proj_tokens > 0 else 0, width=12)
+            tkn_str = self._format_tokens(proj_tokens)
+            rows.append(self._row(_BAR_ROW(clean_name, bar, tkn_str)))
+        return rows
 
     def render(
         self,
@@ -165,6 +391,70 @@ class SimpleDisplayComponent:
         usage_over_time: Optional[Dict[str, int]] = None,
         burn_rate: float = 0.0,
         current_model: str = "opus",
+    ) -> Text:
+        """Render the simplified status card, reusing identical recent cards.
+
+        Minutes are compared at whole-minute resolution, matching what the
+        card displays.
+
+        Args:
+            tokens_used: Current tokens used
+            token_limit: Token limit
+            minutes_to_reset: Minutes until reset
+            model_distribution: Dict of model name -> percentage
+            project_distribution: Dict of project name -> tokens
+            usage_over_time: Dict with 'window_5hr' and 'weekly' token counts
+            burn_rate: Current token burn rate (tokens/min)
+            current_model: Currently active model name
+
+        Returns:
+            Rich Text renderable
+        """
+        key = (
+            tokens_used,
+            token_limit,
+            int(minutes_to_reset),
+            tuple(model_distribution.items()),
+            tuple(project_distribution.items()) if project_distribution else None,
+            tuple(usage_over_time.items()) if usage_over_time else None,
+            round(burn_rate, 1),
+            current_model,
+        )
+        action_state = get_action_state()
+        cached = self._render_cache.get(key)
+        if cached is not None:
+            text, action = cached
+            # A prompt dismissed since caching must disappear, so re-render
+            if action is None or not action_state.is_dismissed(action):
+                action_state.set_action(action)
+                self._render_cache.move_to_end(key)
+                return text
+
+        text = self._render_uncached(
+            tokens_used,
+            token_limit,
+            minutes_to_reset,
+            model_distribution,
+            project_distribution,
+            usage_over_time,
+            burn_rate,
+            current_model,
+        )
+        self._render_cache[key] = (text, action_state.current_action)
+        if len(self._render_cache) > self.RENDER_CACHE_SIZE:
+            self._render_cache.popitem(last=False)
+        return text
+
+    def _render_uncached(
+        self,
+        tokens_used: int,
+        token_limit: int,
+        minutes_to_reset: float,
+        model_distribution: Dict[str, float],
+        project_distribution: Optional[Dict[str, int]] = None,
+        usage_over_time: Optional[Dict[str, int]] = None,
+        burn_rate: float = 0.0,
+        current_model: str = "opus",
     ) -> Text:
         """Render the simplified status card.
 
@@ -185,47 +475,62 @@ class SimpleDisplayComponent:
         state_name, state_color = self._get_state(usage_pct)
 
         lines = []
+        row = self._row
+        dim_row = self._dim_row
+        empty_line = self._empty_row
+        section_dividers = self._section_dividers
 
         # === HEADER ===
-        title = "Pacman Token Manager"
-        lines.append(f"\033[33m{self.TOP_LEFT}{self.HORIZONTAL * (self.width - 2)}{self.TOP_RIGHT}\033[0m")
-        lines.append(f"\033[33m{self.VERTICAL}  {title}{' ' * (self.width - len(title) - 4)}{self.VERTICAL}\033[0m")
-        lines.append(f"\033[33m{self._horizontal_line()}\033[0m")
+        lines.append(self._top_edge)
+        lines.append(self._title_row)
+        lines.append(self._divider)
 
         # === ALERT (conditional) ===
-        alert = self._get_alert(usage_pct, minutes_to_reset)
+        time_str = self._format_time(minutes_to_reset)
+        alert = self._get_alert(usage_pct, minutes_to_reset, time_str)
         if alert:
             alert_color, alert_text = alert
-            padding = self.width - len(alert_text) - 4
-            lines.append(f"\033[33m{self.VERTICAL}\033[0m  \033[{alert_color}m{alert_text}\033[0m{' ' * padding}\033[33m{self.VERTICAL}\033[0m")
-            lines.append(f"\033[33m{self._horizontal_line()}\033[0m")
+            lines.append(row((alert_text, _CODE_STYLES[alert_color])))
+            lines.append(self._divider)
 
         # === TOKEN STATUS ===
-        lines.append(self._empty_line())
+        lines.append(empty_line)
 
         # Token bar with percentage
         bar = self._render_bar(usage_pct, width=20)
-        pct_str = f"{usage_pct:.0f}%"
-        tkn_line = f"TKN \033[{state_color}m{bar}\033[0m \033[{state_color}m{pct_str:>4}\033[0m  \033[36m{tokens_used:,}\033[0m / {token_limit:,}"
-        tkn_line_stripped = f"TKN {bar} {pct_str:>4}  {tokens_used:,} / {token_limit:,}"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  {tkn_line}{' ' * (self.width - len(tkn_line_stripped) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        # Right-aligned percentage, shared with the current session row
+        pct_str = f"{usage_pct:.0f}%".rjust(4)
+        state_style = _CODE_STYLES[state_color]
+        lines.append(
+            row(
+                "TKN ",
+                (bar, state_style),
+                " ",
+                (pct_str, state_style),
+                "  ",
+                (f"{tokens_used:,}", _STYLE_CYAN),
+                f" / {token_limit:,}",
+            )
+        )
 
         # Tokens left + reset time
         tokens_left = max(0, token_limit - tokens_used)
         left_str = self._format_tokens(tokens_left)
-        time_str = self._format_time(minutes_to_reset)
-        left_line = f"\033[32m{left_str} left\033[0m · Resets in \033[36m{time_str}\033[0m"
-        left_stripped = f"{left_str} left · Resets in {time_str}"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  {left_line}{' ' * (self.width - len(left_stripped) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        lines.append(
+            row(
+                (f"{left_str} left", _STYLE_GREEN),
+                " · Resets in ",
+                (time_str, _STYLE_CYAN),
+            )
+        )
 
-        lines.append(self._empty_line())
+        lines.append(empty_line)
 
         # === USAGE OVER TIME ===
-        lines.append(f"\033[33m{self.LEFT_T}─ Usage over time {self.HORIZONTAL * (self.width - 20)}{self.RIGHT_T}\033[0m")
-        lines.append(self._empty_line())
+        lines.append(section_dividers["Usage over time"])
+        lines.append(empty_line)
 
-        header = "Period             Usage              TKN"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  \033[90m{header}\033[0m{' ' * (self.width - len(header) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        lines.append(dim_row("Period             Usage              TKN"))
 
         if usage_over_time:
             window_5hr = usage_over_time.get("window_5hr", 0)
@@ -237,65 +542,56 @@ class SimpleDisplayComponent:
         # Current session - show percentage of limit (matches Claude /usage)
         bar_session = self._render_bar(usage_pct, width=12)
         tkn_str_session = self._format_tokens(window_5hr)
-        pct_session = f"{usage_pct:.0f}%"
-        time_str = self._format_time(minutes_to_reset)
-        row_session = f"{'Current session':<18} {bar_session} {pct_session:>4} {tkn_str_session:>6}"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  {row_session}{' ' * (self.width - len(row_session) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        row_session = f"{'Current session':<18} {bar_session} {pct_str} {tkn_str_session:>6}"
+        lines.append(row(row_session))
 
         # Reset time for session
-        reset_info = f"Resets in {time_str}"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  \033[90m{reset_info}\033[0m{' ' * (self.width - len(reset_info) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        lines.append(dim_row(f"Resets in {time_str}"))
 
-        lines.append(self._empty_line())
+        lines.append(empty_line)
 
         # Current week - show tokens only (we don't have access to weekly limit)
         tkn_str_weekly = self._format_tokens(weekly)
         row_weekly = f"{'Current week':<18}              {tkn_str_weekly:>6}"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  {row_weekly}{' ' * (self.width - len(row_weekly) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        lines.append(row(row_weekly))
 
         # Note about weekly
-        weekly_note = "(7-day rolling total)"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  \033[90m{weekly_note}\033[0m{' ' * (self.width - len(weekly_note) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        lines.append(dim_row("(7-day rolling total)"))
 
-        lines.append(self._empty_line())
+        lines.append(empty_line)
 
         # === BREAKDOWN ===
-        lines.append(f"\033[33m{self.LEFT_T}─ Breakdown {self.HORIZONTAL * (self.width - 14)}{self.RIGHT_T}\033[0m")
-        lines.append(self._empty_line())
+        lines.append(section_dividers["Breakdown"])
+        lines.append(empty_line)
 
         # By Model
-        header = "By Model           Usage        TKN"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  \033[90m{header}\033[0m{' ' * (self.width - len(header) - 4)}\033[33m{self.VERTICAL}\033[0m")
-
-        sorted_models = sorted(model_distribution.items(), key=lambda x: x[1], reverse=True)
-        max_pct = max(model_distribution.values()) if model_distribution else 1
-
-        for model_name, pct in sorted_models[:2]:
-            display_name = model_name.capitalize()
-            bar = self._render_bar((pct / max_pct) * 100, width=12)
-            model_tokens = int((pct / 100) * tokens_used)
-            tkn_str = self._format_tokens(model_tokens)
-            row = f"{display_name:<18} {bar} {tkn_str}"
-            lines.append(f"\033[33m{self.VERTICAL}\033[0m  {row}{' ' * (self.width - len(row) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        lines.append(dim_row("By Model           Usage        TKN"))
+
+        model_items = tuple(model_distribution.items())
+        lines.extend(
+            self._cached_section(
+                "models",
+                (model_items, tokens_used),
+                lambda: self._model_rows(model_items, tokens_used),
+            )
+        )
 
-        lines.append(self._empty_line())
+        lines.append(empty_line)
 
         # By Project
         if project_distribution:
-            header = "By Project         Usage        TKN"
-            lines.append(f"\033[33m{self.VERTICAL}\033[0m  \033[90m{header}\033[0m{' ' * (self.width - len(header) - 4)}\033[33m{self.VERTICAL}\033[0m")
+            lines.append(dim_row("By Project         Usage        TKN"))
 
-            sorted_projects = sorted(project_distribution.items(), key=lambda x: x[1], reverse=True)
-            max_proj_tokens = max(project_distribution.values()) if project_distribution else 1
+            project_items = tuple(project_distribution.items())
+            lines.extend(
+                self._cached_section(
+                    "projects",
+                    (project_items,),
+                    lambda: self._project_rows(project_items),
+                )
+            )
 
-            for proj_name, proj_tokens in sorted_projects[:3]:
-                clean_name = self._clean_project_name(proj_name)
-                bar = self._render_bar((proj_tokens / max_proj_tokens) * 100 if max_proj_tokens > 0 else 0, width=12)
-                tkn_str = self._format_tokens(proj_tokens)
-                row = f"{clean_name:<18} {bar} {tkn_str}"
-                lines.append(f"\033[33m{self.VERTICAL}\033[0m  {row}{' ' * (self.width - len(row) - 4)}\033[33m{self.VERTICAL}\033[0m")
-
-            lines.append(self._empty_line())
+            lines.append(empty_line)
 
         # === GUIDANCE ===
         guidance = get_primary_guidance(
@@ -306,16 +602,13 @@ class SimpleDisplayComponent:
             current_model=current_model,
         )
 
-        lines.append(f"\033[33m{self.LEFT_T}─ Guidance {self.HORIZONTAL * (self.width - 13)}{self.RIGHT_T}\033[0m")
-        lines.append(self._empty_line())
+        lines.append(section_dividers["Guidance"])
+        lines.append(empty_line)
 
         # Word-wrap the guidance text to fit within the box
         content_width = self.width - 6  # Account for borders and padding
-        wrapped_lines = self._wrap_text(guidance.primary, content_width)
-
-        for wrapped_line in wrapped_lines:
-            padding = self.width - len(wrapped_line) - 4
-            lines.append(f"\033[33m{self.VERTICAL}\033[0m  {wrapped_line}{' ' * padding}\033[33m{self.VERTICAL}\033[0m")
+        for wrapped_line in _wrap_words(guidance.primary, content_width):
+            lines.append(row(wrapped_line))
 
         # Add action prompt if available and not dismissed
         action_state = get_action_state()
@@ -330,25 +623,30 @@ class SimpleDisplayComponent:
             # Set this as the current action for keyboard handling
             action_state.set_action(guidance.action_command)
 
-            lines.append(self._empty_line())
+            lines.append(empty_line)
             # Format: → Switch to Sonnet?  [Y]es  [N]o thanks
-            action_line = f"\033[36m→\033[0m {guidance.action_prompt}  \033[32m[Y]\033[0mes  \033[90m[N]\033[0mo thanks"
-            action_stripped = f"→ {guidance.action_prompt}  [Y]es  [N]o thanks"
-            padding = self.width - len(action_stripped) - 4
-            lines.append(f"\033[33m{self.VERTICAL}\033[0m  {action_line}{' ' * padding}\033[33m{self.VERTICAL}\033[0m")
+            lines.append(
+                row(
+                    ("→", _STYLE_CYAN),
+                    f" {guidance.action_prompt}  ",
+                    ("[Y]", _STYLE_GREEN),
+                    "es  ",
+                    ("[N]", _STYLE_DIM),
+                    "o thanks",
+                )
+            )
         else:
             # Clear current action if no action to show
             action_state.clear_action()
 
-        lines.append(self._empty_line())
+        lines.append(empty_line)
 
         # === FOOTER ===
-        footer = "Ctrl+C to exit"
-        lines.append(f"\033[33m{self.VERTICAL}\033[0m  \033[90m{footer}\033[0m{' ' * (self.width - len(footer) - 4)}\033[33m{self.VERTICAL}\033[0m")
+        lines.append(dim_row("Ctrl+C to exit"))
 
-        lines.append(f"\033[33m{self.BOTTOM_LEFT}{self.HORIZONTAL * (self.width - 2)}{self.BOTTOM_RIGHT}\033[0m")
+        lines.append(self._bottom_edge)
 
-        return Text.from_ansi("\n".join(lines))
+        return _NEWLINE.join(lines)
 
     def render_to_console(self, **kwargs) -> None:
         """Render directly to console."""
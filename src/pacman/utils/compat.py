@@ -0,0 +1,10 @@
+"""Python version compatibility helpers for Claude Monitor."""
+
+import sys
+from typing import Dict
+
+# dataclass(slots=True) needs Python 3.10+; older versions keep a __dict__.
+# Usage: @dataclass(frozen=True, **DATACLASS_SLOTS)
+DATACLASS_SLOTS: Dict[str, bool] = (
+    {"slots": True} if sys.version_info >= (3, 10) else {}
+)
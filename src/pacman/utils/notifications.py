@@ -3,7 +3,7 @@
 import json
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 
 
 class NotificationManager:
@@ -97,6 +97,24 @@ class NotificationManager:
         cooldown_seconds: float = cooldown_hours * 3600
         return time_since_last.total_seconds() >= cooldown_seconds
 
+    def get_state(
+        self, key: str, cooldown_hours: Union[int, float] = 24
+    ) -> Tuple[bool, bool]:
+        """Get (should_notify, is_active) for a notification in one lookup."""
+        state = self.states.get(key)
+        if state is None:
+            self.states[key] = {"triggered": False, "timestamp": None}
+            return True, False
+
+        triggered = bool(state["triggered"])
+        timestamp_value = state["timestamp"]
+        is_active = triggered and timestamp_value is not None
+        if not triggered or not isinstance(timestamp_value, datetime):
+            return True, is_active
+
+        time_since_last: timedelta = datetime.now() - timestamp_value
+        return time_since_last.total_seconds() >= cooldown_hours * 3600, is_active
+
     def mark_notified(self, key: str) -> None:
         """Mark notification as shown."""
         now: datetime = datetime.now()
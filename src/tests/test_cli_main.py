@@ -1,8 +1,11 @@
 """Simplified tests for CLI main module."""
 
+import os
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import pytest
+
 from pacman.cli.main import main
 
 
@@ -110,21 +113,58 @@ class TestFunctions:
 
     def test_discover_claude_data_paths_no_paths(self) -> None:
         """Test discover with no existing paths."""
-        from pacman.cli.main import discover_claude_data_paths
+        from pacman.cli.main import _discover_data_paths, discover_claude_data_paths
 
-        with patch("pathlib.Path.exists", return_value=False):
+        _discover_data_paths.cache_clear()
+        with patch("os.path.isdir", return_value=False):
             paths = discover_claude_data_paths()
             assert paths == []
 
     def test_discover_claude_data_paths_with_custom(self) -> None:
         """Test discover with custom paths."""
-        from pacman.cli.main import discover_claude_data_paths
+        from pacman.cli.main import _discover_data_paths, discover_claude_data_paths
 
+        _discover_data_paths.cache_clear()
         custom_paths = ["/custom/path"]
-        with (
-            patch("pathlib.Path.exists", return_value=True),
-            patch("pathlib.Path.is_dir", return_value=True),
-        ):
+        with patch("os.path.isdir", return_value=True):
             paths = discover_claude_data_paths(custom_paths)
             assert len(paths) == 1
             assert paths[0].name == "path"
+
+    def test_discover_claude_data_paths_is_memoized(self) -> None:
+        """Test repeated discovery reuses the first result without stat calls."""
+        from pacman.cli.main import _discover_data_paths, discover_claude_data_paths
+
+        _discover_data_paths.cache_clear()
+        custom_paths = ["/custom/memo"]
+        with patch("os.path.isdir", return_value=True) as mock_isdir:
+            first = discover_claude_data_paths(custom_paths)
+            second = discover_claude_data_paths(custom_paths)
+
+        assert first == second
+        assert first is not second
+        assert mock_isdir.call_count == 1
+
+    def test_key_loop_waits_for_interrupt_once_stdin_closes(self) -> None:
+        """Test an EOF on stdin hands off to the wait instead of re-polling."""
+        from pacman.cli.main import _read_keys_until_interrupt
+        from pacman.terminal import input_handler
+
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        with (
+            os.fdopen(read_fd) as closed_stdin,
+            patch("sys.stdin", closed_stdin),
+            patch.object(input_handler, "keyboard_available", return_value=True),
+            patch.object(
+                input_handler, "poll_keyboard", wraps=input_handler.poll_keyboard
+            ) as mock_poll,
+            patch(
+                "pacman.cli.main._wait_for_interrupt", side_effect=KeyboardInterrupt
+            ) as mock_wait,
+            pytest.raises(KeyboardInterrupt),
+        ):
+            _read_keys_until_interrupt()
+
+        mock_poll.assert_called_once_with(timeout=None)
+        mock_wait.assert_called_once()
@@ -1,16 +1,23 @@
 """Tests for DisplayController class."""
 
+import io
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict
 from unittest.mock import Mock, patch
 
 import pytest
+from rich.console import Console
+from rich.text import Text
 
 from pacman.ui.display_controller import (
     DisplayController,
     LiveDisplayManager,
+    PacManBorder,
     ScreenBufferManager,
     SessionCalculator,
+    SynchronizedLive,
+    _normalized,
+    _visible_len,
 )
 
 
@@ -174,19 +181,15 @@ class TestDisplayController:
         """Test notification checking for switch to custom."""
         with (
             patch.object(
-                controller.notification_manager, "should_notify"
-            ) as mock_should,
+                controller.notification_manager, "get_state"
+            ) as mock_state,
             patch.object(controller.notification_manager, "mark_notified") as mock_mark,
-            patch.object(
-                controller.notification_manager, "is_notification_active"
-            ) as mock_active,
         ):
-            # Configure should_notify to return True only for switch_to_custom
-            def should_notify_side_effect(notification_type):
-                return notification_type == "switch_to_custom"
+            # Configure get_state to fire only for switch_to_custom
+            def get_state_side_effect(notification_type):
+                return notification_type == "switch_to_custom", False
 
-            mock_should.side_effect = should_notify_side_effect
-            mock_active.return_value = False
+            mock_state.side_effect = get_state_side_effect
 
             result = controller._check_notifications(
                 token_limit=500000,
@@ -200,7 +203,7 @@ class TestDisplayController:
             assert result["show_switch_notification"] is True
             # Verify switch_to_custom was called
             assert any(
-                call[0][0] == "switch_to_custom" for call in mock_should.call_args_list
+                call[0][0] == "switch_to_custom" for call in mock_state.call_args_list
             )
             mock_mark.assert_called_with("switch_to_custom")
 
@@ -208,19 +211,15 @@ class TestDisplayController:
         """Test notification checking for exceeding limit."""
         with (
             patch.object(
-                controller.notification_manager, "should_notify"
-            ) as mock_should,
+                controller.notification_manager, "get_state"
+            ) as mock_state,
             patch.object(controller.notification_manager, "mark_notified") as mock_mark,
-            patch.object(
-                controller.notification_manager, "is_notification_active"
-            ) as mock_active,
         ):
-            # Configure should_notify to return True only for exceed_max_limit
-            def should_notify_side_effect(notification_type):
-                return notification_type == "exceed_max_limit"
+            # Configure get_state to fire only for exceed_max_limit
+            def get_state_side_effect(notification_type):
+                return notification_type == "exceed_max_limit", False
 
-            mock_should.side_effect = should_notify_side_effect
-            mock_active.return_value = False
+            mock_state.side_effect = get_state_side_effect
 
             result = controller._check_notifications(
                 token_limit=200000,
@@ -234,7 +233,7 @@ class TestDisplayController:
             assert result["show_exceed_notification"] is True
             # Verify exceed_max_limit was called
             assert any(
-                call[0][0] == "exceed_max_limit" for call in mock_should.call_args_list
+                call[0][0] == "exceed_max_limit" for call in mock_state.call_args_list
             )
             mock_mark.assert_called_with("exceed_max_limit")
 
@@ -242,11 +241,11 @@ class TestDisplayController:
         """Test notification checking for cost will exceed."""
         with (
             patch.object(
-                controller.notification_manager, "should_notify"
-            ) as mock_should,
+                controller.notification_manager, "get_state"
+            ) as mock_state,
             patch.object(controller.notification_manager, "mark_notified") as mock_mark,
         ):
-            mock_should.return_value = True
+            mock_state.return_value = (True, False)
 
             # Predicted end time before reset time
             predicted_end = datetime.now(timezone.utc) + timedelta(hours=1)
@@ -262,7 +261,7 @@ class TestDisplayController:
             )
 
             assert result["show_cost_will_exceed"] is True
-            mock_should.assert_called_with("cost_will_exceed")
+            mock_state.assert_called_with("cost_will_exceed")
             mock_mark.assert_called_with("cost_will_exceed")
 
     @patch("pacman.ui.display_controller.TimezoneHandler")
@@ -297,6 +296,54 @@ class TestDisplayController:
         assert "reset_time_str" in result
         assert "current_time_str" in result
 
+    def test_format_display_times_caches_timezones(self, controller, sample_args):
+        """Test timezone objects are reused across frames."""
+        current_time = datetime.now(timezone.utc)
+        reset_time = current_time + timedelta(hours=5)
+
+        controller._format_display_times(
+            sample_args, current_time, reset_time, reset_time
+        )
+        tz_handler = controller._tz_handler_cache["Europe/Warsaw"]
+        display_tz = controller._pytz_cache["UTC"]
+
+        controller._format_display_times(
+            sample_args, current_time, reset_time, reset_time
+        )
+        assert controller._tz_handler_cache["Europe/Warsaw"] is tz_handler
+        assert controller._pytz_cache["UTC"] is display_tz
+
+    @patch("pacman.ui.display_controller.calculate_hourly_burn_rate")
+    def test_get_burn_rate_memoized_per_minute(self, mock_burn_rate, controller):
+        """Test burn rate is computed once per block list and minute."""
+        mock_burn_rate.return_value = 4.2
+        blocks = [{"isActive": True}]
+        current_time = datetime(2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc)
+
+        assert controller._get_burn_rate(blocks, current_time) == 4.2
+        assert (
+            controller._get_burn_rate(blocks, current_time + timedelta(seconds=30))
+            == 4.2
+        )
+        assert mock_burn_rate.call_count == 1
+
+        blocks.append({"isActive": False})
+        controller._get_burn_rate(blocks, current_time)
+        assert mock_burn_rate.call_count == 2
+
+        blocks[0]["totalTokens"] = 500
+        controller._get_burn_rate(blocks, current_time)
+        assert mock_burn_rate.call_count == 3
+
+    def test_border_is_static_follows_shared_border(self, controller):
+        """Test static-frame detection reflects the shared border state."""
+        border = Mock(is_static=True)
+        with patch(
+            "pacman.ui.display_controller.get_pacman_border", return_value=border
+        ) as mock_get_border:
+            assert controller.border_is_static(no_motion=True) is True
+            mock_get_border.assert_called_once_with(True)
+
     def test_calculate_model_distribution_empty_stats(self, controller):
         """Test model distribution calculation with empty stats."""
         result = controller._calculate_model_distribution({})
@@ -309,6 +356,7 @@ class TestDisplayController:
             "claude-3-opus": "claude-3-opus",
             "claude-3-5-sonnet": "claude-3.5-sonnet",
         }.get(x, "unknown")
+        _normalized.cache_clear()
 
         raw_stats = {
             "claude-3-opus": {"input_tokens": 5000, "output_tokens": 3000},
@@ -316,6 +364,7 @@ class TestDisplayController:
         }
 
         result = controller._calculate_model_distribution(raw_stats)
+        _normalized.cache_clear()
 
         # Total tokens: opus=8000, sonnet=7000, total=15000
         expected_opus_pct = (8000 / 15000) * 100  # ~53.33%
@@ -324,6 +373,25 @@ class TestDisplayController:
         assert abs(result["claude-3-opus"] - expected_opus_pct) < 0.1
         assert abs(result["claude-3.5-sonnet"] - expected_sonnet_pct) < 0.1
 
+    def test_summarize_models_matches_helpers(self, controller):
+        """Test the fused model summary agrees with both helpers."""
+        raw_stats = {
+            "claude-3-opus": {
+                "input_tokens": 5000,
+                "output_tokens": 3000,
+                "cache_read_tokens": 2000,
+            },
+            "claude-3-5-sonnet": {"input_tokens": 4000, "output_tokens": 3000},
+            "broken": "not-a-dict",
+        }
+
+        distribution, contributors = controller._summarize_models(raw_stats)
+
+        assert distribution == controller._calculate_model_distribution(raw_stats)
+        assert contributors == controller._calculate_top_contributors(raw_stats, [])
+        assert [c["tokens"] for c in contributors] == [10000, 7000]
+        assert abs(sum(c["percentage"] for c in contributors) - 100) < 0.01
+
     def test_create_data_display_no_data(self, controller, sample_args):
         """Test create_data_display with no data."""
         result = controller.create_data_display({}, sample_args, 200000)
@@ -477,6 +545,106 @@ class TestLiveDisplayManager:
             vertical_overflow="visible",
         )
 
+    def test_create_live_display_synchronized(self):
+        """Test synchronized live displays wrap each frame in DEC 2026 codes."""
+        output = io.StringIO()
+        console = Console(file=output, force_terminal=True, width=20)
+
+        manager = LiveDisplayManager()
+        live = manager.create_live_display(
+            auto_refresh=False, console=console, synchronized=True
+        )
+
+        assert isinstance(live, SynchronizedLive)
+        with live:
+            output.seek(0)
+            output.truncate()
+            live.update(Text("frame"), refresh=True)
+            written = output.getvalue()
+
+        assert written.startswith("\x1b[?2026h")
+        assert written.endswith("\x1b[?2026l")
+        assert "frame" in written
+
+
+class TestPacManBorder:
+    """Test cases for PacManBorder rendering."""
+
+    @pytest.mark.parametrize("no_motion", [True, False])
+    def test_text_rendering_matches_ansi_rendering(self, no_motion):
+        """Test styled Text output carries the same glyphs as the ANSI strings."""
+        border = PacManBorder(width=12, height=6, no_motion=no_motion)
+        border._static_only = no_motion
+
+        for _ in range(border._perimeter):
+            assert border.render_top_text().plain in border.render_top()
+            assert border.render_bottom_text().plain in border.render_bottom()
+            middle = border.render_middle_text("abc", 2)
+            assert middle.plain[0] in border.render_middle("abc", 2)
+            assert len(middle.plain) == 12
+            border.advance()
+
+    def test_render_frame_matches_row_methods(self):
+        """Test the fused frame builder agrees with the per-row renderers."""
+        border = PacManBorder(width=12, height=6)
+        border._static_only = False
+        passthrough = Mock()
+        lines = ["abc", "\x1b[31mred\x1b[0m", passthrough, "x" * 20]
+
+        for _ in range(border._perimeter):
+            frame = border.render_frame(lines)
+            assert len(frame) == len(lines) + 2
+            assert frame[0].plain == border.render_top_text().plain
+            assert frame[-1].plain == border.render_bottom_text().plain
+            assert frame[3] is passthrough
+            for row in (1, 2, 4):
+                expected = border.render_middle_text(lines[row - 1], row)
+                assert frame[row].plain == expected.plain
+            border.advance()
+
+    def test_visible_len_ignores_colour_codes(self):
+        """Test visible length skips SGR sequences and keeps plain text as is."""
+        assert _visible_len("plain text") == 10
+        assert _visible_len("\x1b[1;33mwarn\x1b[0m!") == 5
+        assert _visible_len("") == 0
+
+    @pytest.mark.parametrize("no_motion", [True, False])
+    def test_is_static_follows_no_motion(self, no_motion):
+        """Test the static flag is set by no-motion mode on a TTY."""
+        with patch("sys.stdout.isatty", return_value=True):
+            border = PacManBorder(width=12, height=6, no_motion=no_motion)
+
+        assert border.is_static is no_motion
+
+    def test_advance_keeps_static_border_still(self):
+        """Test advancing a static border leaves its frame unchanged."""
+        border = PacManBorder(width=12, height=6, no_motion=True)
+
+        border.advance()
+
+        assert border._position == 0
+        assert border._mouth_open is True
+
+    def test_static_text_is_reused(self):
+        """Test no-motion frames share the precomputed Text objects."""
+        border = PacManBorder(width=12, height=6, no_motion=True)
+
+        assert border.render_top_text() is border.render_top_text()
+        assert border.render_bottom_text() is border.render_bottom_text()
+
+    def test_static_rows_are_reused_and_unstyled(self):
+        """Test no-motion rows are cached per content and keep content unstyled."""
+        border = PacManBorder(width=12, height=6, no_motion=True)
+        border._static_only = True
+
+        first = border.render_frame(["a", "b"])
+        second = border.render_frame(["a", "b"])
+
+        assert first[1] is second[1]
+        assert first[2] is second[2]
+        assert first[1].style == ""
+        assert first[1].plain == "│a         │"
+
 
 class TestScreenBufferManager:
     """Test cases for ScreenBufferManager class."""
@@ -487,7 +655,7 @@ class TestScreenBufferManager:
 
         assert manager.console is None
 
-    @patch("pacman.terminal.themes.get_themed_console")
+    @patch("pacman.ui.display_controller.get_themed_console")
     @patch("pacman.ui.display_controller.Text")
     @patch("pacman.ui.display_controller.Group")
     def test_create_screen_renderable(self, mock_group, mock_text, mock_get_console):
@@ -510,7 +678,7 @@ class TestScreenBufferManager:
         assert mock_text.from_markup.call_count == 3
         mock_group.assert_called_once()
 
-    @patch("pacman.terminal.themes.get_themed_console")
+    @patch("pacman.ui.display_controller.get_themed_console")
     @patch("pacman.ui.display_controller.Group")
     def test_create_screen_renderable_with_objects(self, mock_group, mock_get_console):
         """Test creating screen renderable with mixed string and object content."""
@@ -762,6 +930,107 @@ class TestDisplayControllerAdvanced:
                     assert result == "error_rendered"
                     mock_error.assert_called_once_with("pro", "UTC")
 
+    def test_create_data_display_reuses_cached_screen(self, sample_args_custom):
+        """Test unchanged data within the same minute skips reprocessing."""
+        with patch("pacman.ui.display_controller.NotificationManager"):
+            controller = DisplayController(use_simple_display=False)
+        sample_args_custom.plan = "pro"
+        data = {"blocks": [{"isActive": True, "totalTokens": 15000, "costUSD": 0.45}]}
+
+        with (
+            patch.object(controller, "_process_active_session_data") as mock_process,
+            patch.object(
+                controller.session_display, "format_active_session_screen"
+            ) as mock_format,
+            patch("pacman.ui.display_controller.datetime") as mock_datetime,
+        ):
+            mock_datetime.now.return_value = datetime(
+                2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc
+            )
+            mock_process.return_value = {"current_time_str": "12:00:05"}
+            mock_format.return_value = ["⏰ 12:00:05"]
+
+            controller.create_data_display(data, sample_args_custom, 200000)
+            controller.create_data_display(data, sample_args_custom, 200000)
+
+            mock_process.assert_called_once()
+            mock_format.assert_called_once()
+
+    def test_create_data_display_rebuilds_when_shown_fields_change(
+        self, sample_args_custom
+    ):
+        """Test a changed message count in the same data dict rebuilds the screen."""
+        with patch("pacman.ui.display_controller.NotificationManager"):
+            controller = DisplayController(use_simple_display=False)
+        sample_args_custom.plan = "pro"
+        active_block = {
+            "isActive": True,
+            "totalTokens": 15000,
+            "costUSD": 0.45,
+            "sentMessagesCount": 3,
+        }
+        data = {"blocks": [active_block]}
+
+        with (
+            patch.object(controller, "_process_active_session_data") as mock_process,
+            patch.object(
+                controller.session_display, "format_active_session_screen"
+            ) as mock_format,
+            patch("pacman.ui.display_controller.datetime") as mock_datetime,
+        ):
+            mock_datetime.now.return_value = datetime(
+                2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc
+            )
+            mock_process.return_value = {"current_time_str": "12:00:05"}
+            mock_format.return_value = ["⏰ 12:00:05"]
+
+            controller.create_data_display(data, sample_args_custom, 200000)
+            active_block["sentMessagesCount"] = 4
+            controller.create_data_display(data, sample_args_custom, 200000)
+
+            assert mock_process.call_count == 2
+            assert mock_format.call_count == 2
+
+    def test_cached_screen_refreshes_only_the_clock_line(self, sample_args_custom):
+        """Test the cached clock update leaves other lines showing that time alone."""
+        with patch("pacman.ui.display_controller.NotificationManager"):
+            controller = DisplayController(use_simple_display=False)
+        sample_args_custom.plan = "pro"
+        sample_args_custom.timezone = "UTC"
+        sample_args_custom.time_format = "24h"
+        data = {"blocks": [{"isActive": True, "totalTokens": 15000, "costUSD": 0.45}]}
+
+        with (
+            patch.object(controller, "_process_active_session_data") as mock_process,
+            patch.object(
+                controller.session_display, "format_active_session_screen"
+            ) as mock_format,
+            patch.object(
+                controller.buffer_manager, "create_screen_renderable"
+            ) as mock_create,
+            patch("pacman.ui.display_controller.datetime") as mock_datetime,
+        ):
+            mock_datetime.now.return_value = datetime(
+                2024, 1, 1, 12, 0, 5, tzinfo=timezone.utc
+            )
+            mock_process.return_value = {"current_time_str": "12:00:05"}
+            mock_format.return_value = [
+                "Reset at 12:00:05",
+                "⏰ [dim]12:00:05[/] 📝 Active session",
+            ]
+            controller.create_data_display(data, sample_args_custom, 200000)
+
+            mock_datetime.now.return_value = datetime(
+                2024, 1, 1, 12, 0, 6, tzinfo=timezone.utc
+            )
+            controller.create_data_display(data, sample_args_custom, 200000)
+
+            mock_format.assert_called_once()
+            assert mock_create.call_args[0][0] == [
+                "Reset at 12:00:05",
+                "⏰ [dim]12:00:06[/] 📝 Active session",
+            ]
+
     def test_process_active_session_data_comprehensive(self, controller):
         """Test _process_active_session_data with comprehensive data."""
         active_block = {
@@ -972,8 +1241,23 @@ class TestSessionCalculator:
             assert result["cost_per_minute"] == 0.0
             assert result["predicted_end_time"] == time_data["reset_time"]
 
+    def test_calculate_cost_predictions_uses_frame_time(self, calculator):
+        """Test predictions reuse the frame time from calculate_time_data."""
+        current_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        time_data = calculator.calculate_time_data({}, current_time)
+        time_data["elapsed_session_minutes"] = 60
+
+        with patch("pacman.ui.display_controller.datetime") as mock_datetime:
+            result = calculator.calculate_cost_predictions(
+                {"session_cost": 1.0}, time_data, 2.0
+            )
+            mock_datetime.now.assert_not_called()
+
+        assert result["predicted_end_time"] == current_time + timedelta(minutes=60)
+
 
 # Test the legacy function
+@patch("pacman.ui.display_controller._screen_buffer_manager", None)
 @patch("pacman.ui.display_controller.ScreenBufferManager")
 def test_create_screen_renderable_legacy(mock_manager_class):
     """Test the legacy create_screen_renderable function."""
@@ -989,3 +1273,7 @@ def test_create_screen_renderable_legacy(mock_manager_class):
     assert result == "rendered"
     mock_manager_class.assert_called_once()
     mock_manager.create_screen_renderable.assert_called_once_with(screen_buffer)
+
+    # Later calls reuse the shared manager
+    create_screen_renderable(screen_buffer)
+    mock_manager_class.assert_called_once()
@@ -0,0 +1,172 @@
+"""Tests for the MCP server's usage reading and statistics."""
+
+import json
+import os
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from pacman.mcp import server
+from pacman.mcp.server import calculate_usage_stats, read_usage_blocks
+
+
+def _usage_line(tokens: int) -> str:
+    """Return one JSONL usage line with the given token count."""
+    return json.dumps({"type": "usage", "totalTokens": tokens}) + "\n"
+
+
+def _other_line() -> str:
+    """Return one JSONL line that is not a usage entry."""
+    return json.dumps({"type": "assistant", "message": "usage report"}) + "\n"
+
+
+def _write(path: Path, text: str) -> None:
+    """Write text to path and move its mtime forward so the change is seen."""
+    old_mtime_ns = path.stat().st_mtime_ns if path.exists() else 0
+    path.write_text(text)
+    mtime_ns = max(path.stat().st_mtime_ns, old_mtime_ns + 1_000_000)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def _full_parse(data_path: Path) -> List[Dict[str, Any]]:
+    """Read usage blocks without any previously cached state."""
+    saved = dict(server._file_cache)
+    server._file_cache.clear()
+    try:
+        return read_usage_blocks(data_path)
+    finally:
+        server._file_cache.clear()
+        server._file_cache.update(saved)
+
+
+@pytest.fixture(autouse=True)
+def empty_file_cache() -> Iterator[None]:
+    """Start and finish every test with an empty per-file cache."""
+    server._file_cache.clear()
+    yield
+    server._file_cache.clear()
+
+
+class TestReadUsageBlocks:
+    """Test incremental reading of usage entries from JSONL files."""
+
+    def test_appended_lines_are_parsed_from_the_cached_offset(
+        self, tmp_path: Path
+    ) -> None:
+        log = tmp_path / "session.jsonl"
+        _write(log, _usage_line(1) + _other_line())
+        read_usage_blocks(tmp_path)
+        offset = server._file_cache[str(log)].offset
+
+        _write(log, log.read_text() + _usage_line(2))
+        blocks = read_usage_blocks(tmp_path)
+
+        assert blocks == _full_parse(tmp_path)
+        assert [b["totalTokens"] for b in blocks] == [1, 2]
+        assert server._file_cache[str(log)].offset > offset
+
+    def test_same_size_rewrite_is_reparsed(self, tmp_path: Path) -> None:
+        log = tmp_path / "session.jsonl"
+        _write(log, _usage_line(1) + _usage_line(2))
+        read_usage_blocks(tmp_path)
+
+        _write(log, _usage_line(3) + _usage_line(4))
+        blocks = read_usage_blocks(tmp_path)
+
+        assert blocks == _full_parse(tmp_path)
+        assert [b["totalTokens"] for b in blocks] == [3, 4]
+
+    def test_rewrite_with_more_data_is_reparsed(self, tmp_path: Path) -> None:
+        log = tmp_path / "session.jsonl"
+        _write(log, _usage_line(1) + _usage_line(2))
+        read_usage_blocks(tmp_path)
+
+        _write(log, _usage_line(3) + _usage_line(4) + _usage_line(5))
+        blocks = read_usage_blocks(tmp_path)
+
+        assert blocks == _full_parse(tmp_path)
+        assert [b["totalTokens"] for b in blocks] == [3, 4, 5]
+
+    def test_truncated_file_is_reparsed(self, tmp_path: Path) -> None:
+        log = tmp_path / "session.jsonl"
+        _write(log, _usage_line(1) + _usage_line(2) + _usage_line(3))
+        read_usage_blocks(tmp_path)
+
+        _write(log, _usage_line(1))
+        blocks = read_usage_blocks(tmp_path)
+
+        assert blocks == _full_parse(tmp_path)
+        assert [b["totalTokens"] for b in blocks] == [1]
+
+    def test_partial_last_line_is_completed_later(self, tmp_path: Path) -> None:
+        log = tmp_path / "session.jsonl"
+        second = _usage_line(2)
+        _write(log, _usage_line(1) + second[:10])
+        assert [b["totalTokens"] for b in read_usage_blocks(tmp_path)] == [1]
+
+        _write(log, _usage_line(1) + second)
+        blocks = read_usage_blocks(tmp_path)
+
+        assert blocks == _full_parse(tmp_path)
+        assert [b["totalTokens"] for b in blocks] == [1, 2]
+
+    def test_unterminated_last_line_is_not_resumed_past(
+        self, tmp_path: Path
+    ) -> None:
+        log = tmp_path / "session.jsonl"
+        _write(log, _usage_line(1) + _usage_line(2).rstrip("\n"))
+        assert [b["totalTokens"] for b in read_usage_blocks(tmp_path)] == [1, 2]
+
+        _write(log, log.read_text() + "\n" + _usage_line(3))
+        blocks = read_usage_blocks(tmp_path)
+
+        assert blocks == _full_parse(tmp_path)
+        assert [b["totalTokens"] for b in blocks] == [1, 2, 3]
+
+    def test_deleted_file_is_dropped(self, tmp_path: Path) -> None:
+        kept = tmp_path / "kept.jsonl"
+        removed = tmp_path / "nested" / "removed.jsonl"
+        removed.parent.mkdir()
+        _write(kept, _usage_line(1))
+        _write(removed, _usage_line(2))
+        assert len(read_usage_blocks(tmp_path)) == 2
+
+        removed.unlink()
+        blocks = read_usage_blocks(tmp_path)
+
+        assert blocks == _full_parse(tmp_path)
+        assert [b["totalTokens"] for b in blocks] == [1]
+        assert set(server._file_cache) == {str(kept)}
+
+    def test_unchanged_file_is_not_reopened(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        log = tmp_path / "session.jsonl"
+        _write(log, _usage_line(1))
+        first = read_usage_blocks(tmp_path)
+
+        def fail(*args: Any) -> None:
+            raise AssertionError("cached file was parsed again")
+
+        monkeypatch.setattr(server, "_parse_usage_lines", fail)
+        assert read_usage_blocks(tmp_path) == first
+
+
+class TestCalculateUsageStats:
+    """Test usage statistics over usage blocks."""
+
+    def test_blocks_with_malformed_start_times_are_skipped(self) -> None:
+        start_time = (datetime.now() - timedelta(hours=1)).isoformat()
+        blocks = [
+            {"isActive": True, "totalTokens": 100, "startTime": start_time},
+            {"totalTokens": 20, "startTime": 1700000000},
+            {"totalTokens": 30, "startTime": None, "resetAt": "2024-01-01"},
+            {"totalTokens": 40, "startTime": ["2024-01-01"]},
+        ]
+
+        stats = calculate_usage_stats(blocks)
+
+        assert stats["weekly"]["tokens_used"] == 100
+        assert stats["current_session"]["tokens_used"] == 100